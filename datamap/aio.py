@@ -0,0 +1,134 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from datamap.columns import Columns
+from datamap.converters import ConverterRegistry
+from datamap.dicts import Module, from_dicts
+from datamap.mappers import T
+from datamap.validation import Validation
+
+CHUNK_SIZE = 32
+
+
+def _map_items(mapping: Callable[..., Any], items: List[Any]) -> List[Any]:
+    mapped = []
+    for item in items:
+        result = mapping(data=item)
+        mapped.append(list(result) if isinstance(result, Iterator) else result)
+    return mapped
+
+
+async def from_dicts_async(
+    data: Union[Dict, List[Dict]],
+    data_class: Optional[Type] = None,
+    data_class_type_key: Optional[str] = None,
+    module: Optional[Module] = None,
+    flatten: bool = False,
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    columnar: bool = False,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Union[Dict, T, List[T], Columns]:
+    mapping = partial(
+        from_dicts,
+        data_class=data_class,
+        data_class_type_key=data_class_type_key,
+        module=module,
+        flatten=flatten,
+        rename=rename,
+        remove=remove,
+        engine=engine,
+        registry=registry,
+        record=record,
+        validation=validation,
+        columnar=columnar,
+        workers=workers,
+    )
+    if executor:
+        mapped = await asyncio.get_running_loop().run_in_executor(
+            executor, _map_items, mapping, [data]
+        )
+        return mapped[0]
+    return mapping(data=data)
+
+
+def from_async_iterable(
+    data: AsyncIterable[Union[Dict, List[Dict]]],
+    data_class: Optional[Type] = None,
+    data_class_type_key: Optional[str] = None,
+    module: Optional[Module] = None,
+    flatten: bool = False,
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    columnar: bool = False,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[Any]:
+    if not isinstance(data, AsyncIterable):
+        raise AttributeError(
+            f"Invalid argument type {type(data).__name__} passed as data, "
+            "expected an async iterable!"
+        )
+    mapping = partial(
+        from_dicts,
+        data_class=data_class,
+        data_class_type_key=data_class_type_key,
+        module=module,
+        flatten=flatten,
+        rename=rename,
+        remove=remove,
+        engine=engine,
+        registry=registry,
+        record=record,
+        validation=validation,
+        columnar=columnar,
+        workers=workers,
+    )
+
+    async def map_rows() -> AsyncIterator[Any]:
+        if executor is None:
+            async for row in data:
+                yield mapping(data=row)
+            return
+        loop = asyncio.get_running_loop()
+        rows = []
+        async for row in data:
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                for mapped in await loop.run_in_executor(
+                    executor, _map_items, mapping, rows
+                ):
+                    yield mapped
+                rows = []
+        if rows:
+            for mapped in await loop.run_in_executor(
+                executor, _map_items, mapping, rows
+            ):
+                yield mapped
+
+    return map_rows()
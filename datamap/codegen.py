@@ -0,0 +1,181 @@
+from dataclasses import Field, MISSING, fields, is_dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    get_args,
+    get_origin,
+)
+
+from dacite.exceptions import MissingValueError
+from dacite.types import is_instance, is_optional
+
+from datamap.errors import locate_error
+from datamap.hints import type_hints
+from datamap.validation import instance_types, type_error
+
+T = TypeVar("T")
+
+ConverterResolver = Callable[[Field, type], Callable[[Any], Any]]
+
+
+def _contains_dataclass(type_: Any) -> bool:
+    if is_dataclass(type_):
+        return True
+    return any(map(_contains_dataclass, get_args(type_)))
+
+
+def nested_data_class(type_: Any) -> Optional[Tuple[Type, bool]]:
+    if is_optional(type_) and len(get_args(type_)) == 2:
+        type_ = next(arg for arg in get_args(type_) if arg is not type(None))
+    if isinstance(type_, type) and is_dataclass(type_):
+        return type_, False
+    if get_origin(type_) is list and len(get_args(type_)) == 1:
+        item_type = get_args(type_)[0]
+        if isinstance(item_type, type) and is_dataclass(item_type):
+            return item_type, True
+    return None
+
+
+def is_supported(data_class: Type) -> bool:
+    return all(
+        nested_data_class(type_) or not _contains_dataclass(type_)
+        for type_ in type_hints(data_class).values()
+    )
+
+
+def _type_check(value: str, type_: Any, type_name: str) -> str:
+    if type_ is Any:
+        return "True"
+    types = instance_types(type_)
+    if types is type_:
+        return f"isinstance({value}, {type_name})"
+    if types is not None:
+        return f"isinstance({value}, {type_name}.__args__)"
+    return f"is_instance({value}, {type_name})"
+
+
+def _default(attribute: Field, type_: Any, index: int, is_tuple: bool) -> str:
+    if attribute.default is not MISSING:
+        return f"_{index} = _d{index}"
+    if attribute.default_factory is not MISSING:  # type: ignore
+        return f"_{index} = _d{index}()"
+    if is_optional(type_):
+        return f"_{index} = None"
+    if not attribute.init:
+        return f"_{index} = None" if is_tuple else f"_{index} = MISSING"
+    return f"raise MissingValueError({attribute.name!r}) from None"
+
+
+def _value_lines(
+    index: int, name: str, type_: Any, convert: bool, check_types: bool
+) -> List[str]:
+    lines: List[str] = []
+    if convert:
+        lines.extend(
+            [
+                f"        converter = _c{index}.get(type(value))",
+                "        if converter is None:",
+                f"            converter = _resolve(_f{index}, type(value))",
+                "        else:",
+                "            hits += 1",
+                "        try:",
+                "            value = converter(value)",
+                "        except Exception as error:",
+                f"            _locate(error, {name!r}, value)",
+                "            raise",
+            ]
+        )
+    if check_types:
+        lines.extend(
+            [
+                f"        if not {_type_check('value', type_, f'_t{index}')}:",
+                f"            raise _type_error(_t{index}, value, {name!r})",
+            ]
+        )
+    return lines
+
+
+def generate_builder(
+    data_class: Type[T],
+    converters: Dict[str, Dict[type, Callable[[Any], Any]]],
+    resolve_converter: ConverterResolver,
+    convert: bool = True,
+    record_class: Optional[Type] = None,
+    check_types: bool = True,
+    count_hits: Optional[Callable[[int], None]] = None,
+) -> Callable[[Dict], T]:
+    hints = type_hints(data_class)
+    record_class = record_class or data_class
+    tuple_class = None
+    if not is_dataclass(record_class) and hasattr(data_class, "__post_init__"):
+        tuple_class, record_class = record_class, data_class
+    is_tuple = not is_dataclass(record_class)
+    frozen = is_tuple or record_class.__dataclass_params__.frozen  # type: ignore
+    namespace: Dict[str, Any] = {
+        "_tuple": tuple_class,
+        "MISSING": MISSING,
+        "MissingValueError": MissingValueError,
+        "_type_error": type_error,
+        "is_instance": is_instance,
+        "_cls": record_class,
+        "_resolve": resolve_converter,
+        "_count_hits": count_hits,
+        "_locate": locate_error,
+    }
+    lines: List[str] = ["def build(data):"]
+    if convert:
+        lines.append("    hits = 0")
+    init_arguments: List[str] = []
+    post_init: List[str] = []
+    for index, attribute in enumerate(fields(data_class)):
+        name = attribute.name
+        type_ = hints[name]
+        namespace[f"_f{index}"] = attribute
+        namespace[f"_t{index}"] = type_
+        namespace[f"_c{index}"] = converters.setdefault(name, {})
+        if attribute.default is not MISSING:
+            namespace[f"_d{index}"] = attribute.default
+        elif attribute.default_factory is not MISSING:  # type: ignore
+            namespace[f"_d{index}"] = attribute.default_factory  # type: ignore
+        lines.extend(
+            [
+                f"    value = data.get({name!r}, MISSING)",
+                "    if value is not MISSING:",
+            ]
+        )
+        lines.extend(_value_lines(index, name, type_, convert, check_types))
+        lines.extend(
+            [
+                f"        _{index} = value",
+                "    else:",
+                f"        {_default(attribute, type_, index, is_tuple)}",
+            ]
+        )
+        if attribute.init or is_tuple:
+            init_arguments.append(f"{name}=_{index}")
+        elif not frozen:
+            post_init.extend(
+                [
+                    f"    if _{index} is not MISSING:",
+                    f"        instance.{name} = _{index}",
+                ]
+            )
+    lines.append(f"    instance = _cls({', '.join(init_arguments)})")
+    lines.extend(post_init)
+    if convert and count_hits is not None:
+        lines.append("    _count_hits(hits)")
+    if tuple_class is not None:
+        values = ", ".join(
+            f"getattr(instance, {attribute.name!r}, None)"
+            for attribute in fields(data_class)
+        )
+        lines.append(f"    instance = _tuple({values})")
+    lines.append("    return instance")
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["build"]
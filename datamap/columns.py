@@ -0,0 +1,57 @@
+from array import array
+from dataclasses import MISSING, Field, fields
+from typing import Any, Dict, List, MutableSequence, Optional, Type, get_args
+
+from dacite.exceptions import MissingValueError
+from dacite.types import is_optional
+
+from datamap.hints import type_hints
+
+ARRAY_TYPE_CODES: Dict[type, str] = {
+    int: "q",
+    float: "d",
+}
+
+Columns = Dict[str, MutableSequence[Any]]
+
+
+def default_value(attribute: Field, attribute_type: Any) -> Any:
+    if attribute.default is not MISSING:
+        return attribute.default
+    if attribute.default_factory is not MISSING:  # type: ignore
+        return attribute.default_factory()  # type: ignore
+    if is_optional(attribute_type):
+        return None
+    raise MissingValueError(attribute.name)
+
+
+def array_type_code(attribute_type: Any) -> Optional[str]:
+    if is_optional(attribute_type) and len(get_args(attribute_type)) == 2:
+        attribute_type = next(
+            arg for arg in get_args(attribute_type) if arg is not type(None)
+        )
+    return ARRAY_TYPE_CODES.get(attribute_type)
+
+
+def to_column(attribute_type: Any, values: List[Any]) -> MutableSequence[Any]:
+    type_code = array_type_code(attribute_type)
+    if type_code:
+        try:
+            return array(type_code, values)
+        except (TypeError, OverflowError):
+            pass
+    return values
+
+
+def to_columns(data_class: Type, records: List[Dict]) -> Columns:
+    hints = type_hints(data_class)
+    columns: Columns = {}
+    for attribute in fields(data_class):
+        name = attribute.name
+        missing = object()
+        values = [record.get(name, missing) for record in records]
+        if any(value is missing for value in values):
+            default = default_value(attribute, hints[name])
+            values = [default if value is missing else value for value in values]
+        columns[name] = to_column(hints[name], values)
+    return columns
@@ -1,12 +1,21 @@
 import re
-from copy import deepcopy
 from dataclasses import Field
-from functools import lru_cache
 from itertools import chain
-from typing import Iterable, Dict, Callable, Any, get_args, Optional
+from typing import (
+    Iterable,
+    Dict,
+    Callable,
+    Any,
+    get_args,
+    Optional,
+    Tuple,
+    List,
+    NamedTuple,
+)
 
 from more_itertools import flatten
 
+from datamap.hints import field_type
 from datamap.time import parse_timestamp
 
 
@@ -14,22 +23,90 @@ def identity(value: Optional[Any]) -> Optional[Any]:
     return value
 
 
-converters: Dict[str, Callable[[Any], Any]] = {
-    "int_datetime": parse_timestamp,
-}
+def convert_many(converter: Callable[[Any], Any], values: List[Any]) -> List[Any]:
+    batch_converter = getattr(converter, "convert_many", None)
+    if batch_converter:
+        return batch_converter(values)
+    return list(map(converter, values))
 
 
-def converter_names(value: Any, attribute_type_names: Iterable[str]) -> Iterable[str]:
+JSON_TYPES: Tuple[type, ...] = (str, int, float, bool, type(None), list, dict)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class Converters(Dict[str, Callable[[Any], Any]]):
+    version: int = 0
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, key: str, value: Callable[[Any], Any]) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(
+        self, key: str, default: Callable[[Any], Any]
+    ) -> Callable[[Any], Any]:
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def pop(self, key: str, *args) -> Callable[[Any], Any]:
+        value = super().pop(key, *args)
+        self._changed()
+        return value
+
+    def popitem(self) -> Tuple[str, Callable[[Any], Any]]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+
+converters: Converters = Converters(
+    {
+        "int_datetime": parse_timestamp,
+    }
+)
+
+
+def type_converter_names(
+    value_type: type, attribute_type_names: Iterable[str]
+) -> Iterable[str]:
     return chain(
         map(
-            lambda attribute_type_name: f"{type(value).__name__}_{attribute_type_name}".lower(),
+            lambda attribute_type_name: f"{value_type.__name__}_{attribute_type_name}".lower(),
             attribute_type_names,
         ),
         map(str.lower, attribute_type_names),
     )
 
 
+def converter_names(value: Any, attribute_type_names: Iterable[str]) -> Iterable[str]:
+    return type_converter_names(type(value), attribute_type_names)
+
+
 def resolve_attribute_type_names(attribute: Field) -> Iterable[str]:
+    known_type = field_type(attribute)
+    if known_type and known_type.type_names:
+        return list(known_type.type_names)
     if isinstance(attribute.type, str):
         return list(
             flatten(
@@ -48,28 +125,159 @@ def resolve_attribute_type_names(attribute: Field) -> Iterable[str]:
     ) or ([attribute.type.__name__] if hasattr(attribute.type, "__name__") else [])
 
 
-@lru_cache(typed=True)
-def resolve_converter(attribute: Field, value: Any) -> Callable[[Any], Any]:
-    attribute_type_names = resolve_attribute_type_names(attribute)
-    converter = next(
+def resolve_attribute_types(attribute: Field) -> List[type]:
+    known_type = field_type(attribute)
+    if known_type:
+        return list(known_type.types)
+    if isinstance(attribute.type, str):
+        return []
+    return list(
         filter(
-            None,
-            map(
-                converters.get,
-                converter_names(value, attribute_type_names),
-            ),
-        ),
-        identity,
+            lambda attribute_type: hasattr(attribute_type, "__mro__"),
+            get_args(attribute.type) or [attribute.type],
+        )
     )
-    return converter
 
 
-def convert_attributes(attributes: Iterable[Field], data: Dict) -> Dict:
-    data = deepcopy(data)
+class ConverterRegistry:
+    def __init__(
+        self,
+        parent: Optional["ConverterRegistry"] = None,
+        names: Optional[Converters] = None,
+    ):
+        self.parent = parent
+        self.names = names if names is not None else Converters()
+        self._converters: Dict[Tuple[type, type], Callable[[Any], Any]] = {}
+        self._version = 0
+        self._index: Dict[Tuple[Field, type], Callable[[Any], Any]] = {}
+        self._index_version = self.version
+        self._hits = 0
+        self._misses = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(vars(self))
+        state.update(_index={}, _hits=0, _misses=0)
+        return state
+
+    @property
+    def version(self) -> int:
+        version = self._version + self.names.version
+        if self.parent:
+            version += self.parent.version
+        return version
+
+    def register(
+        self,
+        source_type: type,
+        target_type: type,
+        converter: Callable[[Any], Any],
+    ) -> None:
+        self._converters[(source_type, target_type)] = converter
+        self._version += 1
+
+    def unregister(self, source_type: type, target_type: type) -> None:
+        del self._converters[(source_type, target_type)]
+        self._version += 1
+
+    def lookup(
+        self, source_type: type, target_type: type
+    ) -> Optional[Callable[[Any], Any]]:
+        for cls in source_type.__mro__:
+            converter = self._converters.get((cls, target_type))
+            if converter:
+                return converter
+        if self.parent:
+            return self.parent.lookup(source_type, target_type)
+        return None
+
+    def lookup_name(
+        self, value_type: type, attribute_type_names: Iterable[str]
+    ) -> Optional[Callable[[Any], Any]]:
+        converter = next(
+            filter(
+                None,
+                map(
+                    self.names.get,
+                    type_converter_names(value_type, attribute_type_names),
+                ),
+            ),
+            None,
+        )
+        if converter is None and self.parent:
+            return self.parent.lookup_name(value_type, attribute_type_names)
+        return converter
+
+    def resolve(self, attribute: Field, value_type: type) -> Callable[[Any], Any]:
+        if self._index_version != self.version:
+            self._index.clear()
+            self._index_version = self.version
+        converter = self._index.get((attribute, value_type))
+        if converter is not None:
+            self._hits += 1
+            return converter
+        self._misses += 1
+        converter = self._resolve(attribute, value_type)
+        bind = getattr(converter, "bind", None)
+        if bind is not None:
+            converter = bind(attribute)
+        if field_type(attribute) is not None or not isinstance(attribute.type, str):
+            self._index[(attribute, value_type)] = converter
+        return converter
+
+    def _resolve(self, attribute: Field, value_type: type) -> Callable[[Any], Any]:
+        for target_type in resolve_attribute_types(attribute):
+            converter = self.lookup(value_type, target_type)
+            if converter:
+                return converter
+        return (
+            self.lookup_name(value_type, resolve_attribute_type_names(attribute))
+            or identity
+        )
+
+    def count_hits(self, hits: int) -> None:
+        self._hits += hits
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, None, len(self._index))
+
+
+default_registry = ConverterRegistry(names=converters)
+
+
+def register_converter(
+    source_type: type, target_type: type, converter: Callable[[Any], Any]
+) -> None:
+    default_registry.register(source_type, target_type, converter)
+
+
+def resolve_type_converter(
+    attribute: Field,
+    value_type: type,
+    registry: Optional[ConverterRegistry] = None,
+) -> Callable[[Any], Any]:
+    return (registry or default_registry).resolve(attribute, value_type)
+
+
+def resolve_converter(attribute: Field, value: Any) -> Callable[[Any], Any]:
+    return resolve_type_converter(attribute, type(value))
+
+
+def converter_cache_info(registry: Optional[ConverterRegistry] = None) -> CacheInfo:
+    return (registry or default_registry).cache_info()
+
+
+def convert_attributes(
+    attributes: Iterable[Field],
+    data: Dict,
+    inplace: bool = False,
+    registry: Optional[ConverterRegistry] = None,
+) -> Dict:
+    if not inplace:
+        data = dict(data)
     for attribute in attributes:
         if attribute.name in data:
             value = data.get(attribute.name)
-            converter = resolve_converter(attribute, value)
+            converter = resolve_type_converter(attribute, type(value), registry)
             converted_value = converter(value)
             data[attribute.name] = converted_value
     return data
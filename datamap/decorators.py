@@ -1,22 +1,97 @@
+from concurrent.futures import Executor
 from functools import wraps
-from typing import Type, Optional, Tuple, Sequence, Dict
+from inspect import isasyncgenfunction, iscoroutinefunction
+from typing import Type, Optional, Tuple, Sequence, Dict, Union
 
-from datamap.dicts import from_dicts, T, rename_keys, remove_keys
+from datamap.aio import from_async_iterable, from_dicts_async
+
+from datamap.converters import ConverterRegistry
+from datamap.dicts import Module, from_dicts, T
+from datamap.keys import KeyTable, compile_key_table
+from datamap.streams import CHUNK_SIZE, from_stream
+from datamap.validation import Validation
 
 
 def datamap(
     data_class: Optional[Type[T]] = None,
     data_class_type_key: Optional[str] = None,
-    module: Optional[str] = None,
+    module: Optional[Module] = None,
+    flatten: bool = False,
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    columnar: bool = False,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+):
+    options = dict(
+        data_class=data_class,
+        data_class_type_key=data_class_type_key,
+        module=module,
+        flatten=flatten,
+        rename=rename,
+        remove=remove,
+        engine=engine,
+        registry=registry,
+        record=record,
+        validation=validation,
+        columnar=columnar,
+        workers=workers,
+    )
+
+    def decorator(method):
+        if isasyncgenfunction(method):
+
+            @wraps(method)
+            async def async_generator_wrapper(*args, **kwargs):
+                async for item in from_async_iterable(
+                    method(*args, **kwargs), executor=executor, **options
+                ):
+                    yield item
+
+            return async_generator_wrapper
+
+        if iscoroutinefunction(method):
+
+            @wraps(method)
+            async def coroutine_wrapper(*args, **kwargs):
+                data = await method(*args, **kwargs)
+                return await from_dicts_async(data=data, executor=executor, **options)
+
+            return coroutine_wrapper
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            data = method(*args, **kwargs)
+            return from_dicts(data=data, **options)
+
+        return wrapper
+
+    return decorator
+
+
+def datastream(
+    data_class: Optional[Type[T]] = None,
+    data_class_type_key: Optional[str] = None,
+    module: Optional[Module] = None,
     flatten: bool = False,
     rename: Sequence[Tuple[str]] = [],
     remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    chunk_size: int = CHUNK_SIZE,
+    prefetch: int = 0,
 ):
     def decorator(method):
         @wraps(method)
         def wrapper(*args, **kwargs):
             data = method(*args, **kwargs)
-            return from_dicts(
+            return from_stream(
                 data=data,
                 data_class=data_class,
                 data_class_type_key=data_class_type_key,
@@ -24,6 +99,12 @@ def datamap(
                 flatten=flatten,
                 rename=rename,
                 remove=remove,
+                engine=engine,
+                registry=registry,
+                record=record,
+                validation=validation,
+                chunk_size=chunk_size,
+                prefetch=prefetch,
             )
 
         return wrapper
@@ -32,29 +113,14 @@ def datamap(
 
 
 def rename_dict_keys(*key_mappings):
-    def decorator(method):
-        @wraps(method)
-        def wrapper(*args, **kwargs):
-            if args:
-                updated_args = []
-                for arg in args:
-                    updated_args.append(
-                        rename_keys(arg, *key_mappings)
-                        if isinstance(arg, Dict)
-                        else arg
-                    )
-                return method(*tuple(updated_args), **kwargs)
-            data = method(*args, **kwargs)
-            if isinstance(data, Dict):
-                return rename_keys(data, *key_mappings)
-            return data
+    return _translate_dict_keys(compile_key_table(key_mappings))
 
-        return wrapper
 
-    return decorator
+def remove_dict_keys(*keys_to_remove):
+    return _translate_dict_keys(compile_key_table((), keys_to_remove))
 
 
-def remove_dict_keys(*keys_to_remove):
+def _translate_dict_keys(key_table: KeyTable):
     def decorator(method):
         @wraps(method)
         def wrapper(*args, **kwargs):
@@ -62,14 +128,12 @@ def remove_dict_keys(*keys_to_remove):
                 updated_args = []
                 for arg in args:
                     updated_args.append(
-                        remove_keys(arg, *keys_to_remove)
-                        if isinstance(arg, Dict)
-                        else arg
+                        key_table(arg) if isinstance(arg, Dict) else arg
                     )
                 return method(*tuple(updated_args), **kwargs)
             data = method(*args, **kwargs)
             if isinstance(data, Dict):
-                return remove_keys(data, *keys_to_remove)
+                return key_table(data)
             return data
 
         return wrapper
@@ -1,125 +1,153 @@
 import logging
-from abc import ABCMeta, abstractmethod
 from collections.abc import Collection
-from copy import deepcopy
-from dataclasses import fields
+from functools import lru_cache
 from types import ModuleType
 from typing import (
     Dict,
-    MutableMapping,
     Type,
     Union,
     List,
     Optional,
-    TypeVar,
     Tuple,
-    Any,
     Iterable,
     Sequence,
+    Mapping,
 )
 
-import dacite
-from inflector import Inflector
-
-from datamap.converters import convert_attributes
-
-
-def pep8_compliant_keys(value: Dict, inflector: Inflector = Inflector()) -> Dict:
-    return {inflector.underscore(key): value for key, value in value.items()}
-
-
-class KeyMergerStrategy(metaclass=ABCMeta):
-    @abstractmethod
-    def apply(self, parent_key: str, key: str) -> str:
-        pass
-
-
-class DefaultKeyMergerStrategy(KeyMergerStrategy):
-    def __init__(self):
-        self._inflector = Inflector()
-
-    def apply(self, parent_key: Optional[str], key: str) -> str:
-        if parent_key:
-            return f"{parent_key}{self._inflector.camelize(key)}"
-        return key
-
+from datamap.keys import (  # noqa: F401
+    pep8_compliant_keys,
+    KeyMergerStrategy,
+    DefaultKeyMergerStrategy,
+    flatten_dict,
+    rename_keys,
+    remove_keys,
+    compile_key_table,
+    underscore,
+)
+from datamap.columns import Columns
+from datamap.converters import ConverterRegistry
+from datamap.errors import MappingError
+from datamap.mappers import T, compile_mapper
+from datamap.parallel import map_parallel
+from datamap.validation import Validation
 
-def flatten_dict(
-    records: MutableMapping[Any, Any],
-    parent_key: Optional[str] = None,
-    key_merger=DefaultKeyMergerStrategy(),
-) -> Dict:
-    items: List[Tuple[Any, Any]] = []
-    for key, value in records.items():
-        new_key = key_merger.apply(parent_key, key)
-        if isinstance(value, MutableMapping):
-            items.extend(flatten_dict(value, new_key, key_merger=key_merger).items())
-        else:
-            items.append((new_key, value))
-    return dict(items)
+Module = Union[str, ModuleType, Mapping[str, Type]]
 
+MAX_DATA_CLASS_NAMES = 1024
 
-T = TypeVar("T")
+_data_classes: Dict[Union[str, ModuleType], Dict[str, Optional[Type]]] = {}
 
 
 def from_dict(
     data: Dict,
     data_class: Optional[Type[T]] = None,
     data_class_type_key: Optional[str] = None,
-    module: Optional[Union[str, ModuleType]] = None,
+    module: Optional[Module] = None,
     flatten: bool = False,
     rename: Sequence[Tuple[str]] = [],
     remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
 ) -> Union[Dict, T]:
     if data:
         if not isinstance(data, Dict):
             raise AttributeError(
                 f"Invalid argument type {type(data).__name__} passed as data, expected a dict!"
             )
-        if flatten is True:
-            data = flatten_dict(data)
-        data = pep8_compliant_keys(data)
-        data = rename_keys(data, *rename)
-        data = remove_keys(data, *remove)
-        data_class = resolve_data_class(data, data_class, data_class_type_key, module)
+        normalized = data
+        if data_class is None:
+            if (data_class_type_key or "resource_type") not in data:
+                normalized = _normalize(data, flatten, rename, remove)
+            data_class = resolve_data_class(
+                normalized, None, data_class_type_key, module
+            )
         if data_class:
-            attributes = fields(data_class)
-            data = convert_attributes(attributes, data)
-            return dacite.from_dict(data_class=data_class, data=data)
+            return compile_mapper(
+                data_class,
+                flatten=flatten,
+                rename=rename,
+                remove=remove,
+                engine=engine,
+                registry=registry,
+                record=record,
+                validation=validation,
+            )(data)
+        if normalized is data:
+            normalized = _normalize(data, flatten, rename, remove)
+        return normalized
     return data
 
 
+def _normalize(
+    data: Dict, flatten: bool, rename: Sequence[Tuple[str]], remove: Sequence[str]
+) -> Dict:
+    if flatten is True:
+        data = flatten_dict(data)
+    return compile_key_table(rename, remove).apply(data, translate=underscore)
+
+
 def resolve_data_class(
     data: Dict,
     data_class: Optional[Type[T]] = None,
     data_class_type_key: Optional[str] = None,
-    module: Optional[Union[str, ModuleType]] = None,
+    module: Optional[Module] = None,
 ) -> Optional[Type[T]]:
     if data_class is None and module is not None:
         data_class_name = data.get(
             data_class_type_key if data_class_type_key else "resource_type"
         )
         if data_class_name:
+            if isinstance(module, Mapping):
+                data_class = module.get(data_class_name)
+                if data_class is None:
+                    warn_once(f"No data class registered for {data_class_name!r}")
+                return data_class
+            data_classes = _data_classes.get(module)
+            if data_classes is None:
+                data_classes = _data_classes[module] = {}
             try:
-                if isinstance(module, str):
-                    data_class = getattr(
-                        __import__(module, fromlist=[data_class_name]), data_class_name
-                    )
-                else:
-                    data_class = getattr(module, data_class_name)
-            except AttributeError as e:
-                logging.warning(e)
+                return data_classes[data_class_name]
+            except KeyError:
+                data_class = import_data_class(module, data_class_name)
+                if len(data_classes) < MAX_DATA_CLASS_NAMES:
+                    data_classes[data_class_name] = data_class
     return data_class
 
 
+def import_data_class(
+    module: Union[str, ModuleType], data_class_name: str
+) -> Optional[Type]:
+    try:
+        if isinstance(module, str):
+            return getattr(
+                __import__(module, fromlist=[data_class_name]), data_class_name
+            )
+        return getattr(module, data_class_name)
+    except AttributeError as e:
+        warn_once(str(e))
+    return None
+
+
+@lru_cache(maxsize=1024)
+def warn_once(message: str) -> None:
+    logging.warning(message)
+
+
 def from_iterable(
     data: Union[Dict, List[Dict]],
     data_class: Optional[Type] = None,
     data_class_type_key: Optional[str] = None,
-    module: Optional[Union[str, ModuleType]] = None,
+    module: Optional[Module] = None,
     flatten: bool = False,
     rename: Sequence[Tuple[str]] = [],
     remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    workers: Optional[int] = None,
 ):
     if isinstance(data, Iterable) and not isinstance(data, Collection):
         return map(
@@ -131,6 +159,11 @@ def from_iterable(
                 flatten=flatten,
                 rename=rename,
                 remove=remove,
+                engine=engine,
+                registry=registry,
+                record=record,
+                validation=validation,
+                workers=workers,
             ),
             data,
         )
@@ -144,12 +177,58 @@ def from_collection(
     data: Union[Dict, List[Dict]],
     data_class: Optional[Type] = None,
     data_class_type_key: Optional[str] = None,
-    module: Optional[Union[str, ModuleType]] = None,
+    module: Optional[Module] = None,
     flatten: bool = False,
     rename: Sequence[Tuple[str]] = [],
     remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    columnar: bool = False,
+    workers: Optional[int] = None,
+    errors: Optional[List[MappingError]] = None,
 ):
     if isinstance(data, Collection) and not isinstance(data, Dict):
+        if errors is not None and columnar:
+            raise AttributeError("Errors can't be collected for columnar output!")
+        if data_class and workers:
+            return map_parallel(
+                data,
+                data_class,
+                flatten=flatten,
+                rename=rename,
+                remove=remove,
+                engine=engine,
+                registry=registry,
+                record=record,
+                validation=validation,
+                columnar=columnar,
+                workers=workers,
+                errors=errors,
+            )
+        if data_class:
+            mapper = compile_mapper(
+                data_class,
+                flatten=flatten,
+                rename=rename,
+                remove=remove,
+                engine=engine,
+                registry=registry,
+                record=record,
+                validation=validation,
+            )
+            if columnar:
+                return mapper.map_columns(data)
+            return mapper.map_many(data, errors=errors)
+        if columnar:
+            raise AttributeError(
+                "Columnar output requires a data_class, it can't be resolved from a module!"
+            )
+        if errors is not None:
+            raise AttributeError(
+                "Collecting errors requires a data_class, it can't be resolved from a module!"
+            )
         return list(
             map(
                 lambda row: from_dict(
@@ -160,6 +239,10 @@ def from_collection(
                     flatten=flatten,
                     rename=rename,
                     remove=remove,
+                    engine=engine,
+                    registry=registry,
+                    record=record,
+                    validation=validation,
                 ),
                 data,
             )
@@ -173,11 +256,25 @@ def from_dicts(
     data: Union[Dict, List[Dict]],
     data_class: Optional[Type] = None,
     data_class_type_key: Optional[str] = None,
-    module: Optional[Union[str, ModuleType]] = None,
+    module: Optional[Module] = None,
     flatten: bool = False,
     rename: Sequence[Tuple[str]] = [],
     remove: Sequence[str] = [],
-) -> Union[Dict, T, Iterable[Dict], List[T]]:
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    columnar: bool = False,
+    workers: Optional[int] = None,
+    errors: Optional[List[MappingError]] = None,
+) -> Union[Dict, T, Iterable[Dict], List[T], Columns]:
+    if errors is not None and (
+        isinstance(data, Dict) or not isinstance(data, Collection)
+    ):
+        raise AttributeError(
+            f"Invalid argument type {type(data).__name__} passed as data, "
+            "errors can only be collected for a collection!"
+        )
     if isinstance(data, Iterable) and not isinstance(data, Collection):
         return from_iterable(
             data=data,
@@ -187,6 +284,11 @@ def from_dicts(
             flatten=flatten,
             rename=rename,
             remove=remove,
+            engine=engine,
+            registry=registry,
+            record=record,
+            validation=validation,
+            workers=workers,
         )
     if isinstance(data, Collection) and not isinstance(data, Dict):
         return from_collection(
@@ -197,6 +299,13 @@ def from_dicts(
             flatten=flatten,
             rename=rename,
             remove=remove,
+            engine=engine,
+            registry=registry,
+            record=record,
+            validation=validation,
+            columnar=columnar,
+            workers=workers,
+            errors=errors,
         )
     return from_dict(
         data=data,
@@ -206,32 +315,8 @@ def from_dicts(
         flatten=flatten,
         rename=rename,
         remove=remove,
+        engine=engine,
+        registry=registry,
+        record=record,
+        validation=validation,
     )
-
-
-def rename_keys(data: Dict, *key_mappings, **kwargs) -> Dict:
-    if data:
-        if not isinstance(data, Dict):
-            raise AttributeError(
-                f"Invalid argument type {type(data).__name__} passed as data, expected a dict!"
-            )
-        suppress = kwargs.get("suppress_none", False)
-        if key_mappings:
-            data = deepcopy(data)
-            for old_key, new_key in key_mappings:
-                value = data.pop(old_key, None)
-                if value or not suppress:
-                    data[new_key] = value
-    return data
-
-
-def remove_keys(data: Dict, *keys_to_remove: str) -> Dict:
-    if data and keys_to_remove:
-        if not isinstance(data, Dict):
-            raise AttributeError(
-                f"Invalid argument type {type(data).__name__} passed as data, expected a dict!"
-            )
-        return {
-            key: value for key, value in data.items() if key not in set(keys_to_remove)
-        }
-    return data
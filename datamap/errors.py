@@ -0,0 +1,62 @@
+from dataclasses import MISSING
+from typing import Any, Optional
+
+from dacite import DaciteFieldError
+
+
+def locate_error(error: Exception, field: str, value: Any = MISSING) -> None:
+    if isinstance(error, DaciteFieldError) or hasattr(error, "datamap_field"):
+        return
+    try:
+        error.datamap_field = field  # type: ignore
+        error.datamap_value = None if value is MISSING else value  # type: ignore
+    except AttributeError:
+        pass
+
+
+def prefix_error(error: Exception, path: str) -> None:
+    if isinstance(error, DaciteFieldError):
+        error.update_path(path)
+    elif hasattr(error, "datamap_field"):
+        error.datamap_field = f"{path}.{error.datamap_field}"  # type: ignore
+
+
+class MappingError(Exception):
+    def __init__(
+        self,
+        index: int,
+        error: str,
+        field: Optional[str] = None,
+        value: Any = None,
+        exception: Optional[Exception] = None,
+    ):
+        super().__init__(index, error, field, value)
+        self.index = index
+        self.error = error
+        self.field = field
+        self.value = value
+        self.exception = exception
+
+    def __str__(self) -> str:
+        return f"Failed to map row {self.index}: {self.error}"
+
+    def __reduce__(self):
+        return type(self), (self.index, self.error, self.field, self.value)
+
+    @classmethod
+    def of(cls, index: int, error: Exception) -> "MappingError":
+        if isinstance(error, DaciteFieldError):
+            return cls(
+                index,
+                str(error),
+                error.field_path,
+                getattr(error, "value", None),
+                error,
+            )
+        return cls(
+            index,
+            f"{type(error).__name__}: {error}",
+            getattr(error, "datamap_field", None),
+            getattr(error, "datamap_value", None),
+            error,
+        )
@@ -0,0 +1,72 @@
+from dataclasses import Field, fields
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+
+class FieldType(NamedTuple):
+    attribute: Field
+    type: Any
+    types: Tuple[type, ...]
+    type_names: Tuple[str, ...]
+
+
+_field_types: Dict[Field, FieldType] = {}
+
+
+def type_names(type_: Any) -> Tuple[str, ...]:
+    names = tuple(
+        argument.__name__
+        for argument in get_args(type_)
+        if hasattr(argument, "__name__")
+    )
+    if names:
+        return names
+    return (type_.__name__,) if hasattr(type_, "__name__") else ()
+
+
+def target_types(type_: Any) -> Tuple[type, ...]:
+    return tuple(
+        argument
+        for argument in map(
+            lambda argument: get_origin(argument) or argument,
+            get_args(type_) or [type_],
+        )
+        if isinstance(argument, type)
+    )
+
+
+@lru_cache(maxsize=None)
+def field_types(data_class: Type) -> Dict[str, FieldType]:
+    attributes = fields(data_class)
+    try:
+        hints = get_type_hints(data_class)
+    except NameError:
+        hints = {attribute.name: attribute.type for attribute in attributes}
+    index = {}
+    for attribute in attributes:
+        type_ = hints[attribute.name]
+        index[attribute.name] = _field_types[attribute] = FieldType(
+            attribute,
+            type_,
+            () if isinstance(type_, str) else target_types(type_),
+            () if isinstance(type_, str) else type_names(type_),
+        )
+    return index
+
+
+def field_type(attribute: Field) -> Optional[FieldType]:
+    return _field_types.get(attribute)
+
+
+def type_hints(data_class: Type) -> Dict[str, Any]:
+    return {name: field.type for name, field in field_types(data_class).items()}
@@ -0,0 +1,137 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from datamap.converters import CacheInfo, ConverterRegistry
+from datamap.keys import key_cache_info
+
+STAGES = ("flatten", "keys", "convert", "construct")
+
+Observer = Callable[[str, str, float, int], None]
+
+_active: ContextVar[Optional["Instrumentation"]] = ContextVar(
+    "datamap_instrumentation", default=None
+)
+
+current = _active.get
+
+timer = perf_counter
+
+
+def _hit_rate(hits: int, misses: int) -> Dict[str, Any]:
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else None,
+    }
+
+
+def _cache_delta(start: CacheInfo, end: CacheInfo) -> Dict[str, Any]:
+    return _hit_rate(end.hits - start.hits, end.misses - start.misses)
+
+
+class StageMetrics:
+    __slots__ = ("calls", "records", "seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.records = 0
+        self.seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "records": self.records, "seconds": self.seconds}
+
+
+class DataClassMetrics:
+    def __init__(self):
+        self.stages: Dict[str, StageMetrics] = {}
+        self.key_hits = 0
+        self.key_misses = 0
+        self.converters: Dict[str, int] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": {
+                stage: self.stages[stage].to_dict()
+                for stage in STAGES
+                if stage in self.stages
+            },
+            "keys": _hit_rate(self.key_hits, self.key_misses),
+            "converters": dict(self.converters),
+        }
+
+
+class Instrumentation:
+    def __init__(self, observer: Optional[Observer] = None):
+        self.observer = observer
+        self.data_classes: Dict[str, DataClassMetrics] = {}
+        self._key_caches = key_cache_info()
+        self._registries: List[Tuple[ConverterRegistry, CacheInfo]] = []
+
+    def metrics(self, data_class: type) -> DataClassMetrics:
+        metrics = self.data_classes.get(data_class.__name__)
+        if metrics is None:
+            metrics = self.data_classes[data_class.__name__] = DataClassMetrics()
+        return metrics
+
+    def record(
+        self, data_class: type, stage: str, seconds: float, records: int = 1
+    ) -> None:
+        stages = self.metrics(data_class).stages
+        metrics = stages.get(stage)
+        if metrics is None:
+            metrics = stages[stage] = StageMetrics()
+        metrics.calls += 1
+        metrics.records += records
+        metrics.seconds += seconds
+        if self.observer:
+            self.observer(data_class.__name__, stage, seconds, records)
+
+    def count_keys(self, data_class: type, hits: int, misses: int) -> None:
+        metrics = self.metrics(data_class)
+        metrics.key_hits += hits
+        metrics.key_misses += misses
+
+    def count_converter(
+        self, data_class: type, field: str, converter: Callable, invocations: int
+    ) -> None:
+        name = getattr(converter, "__name__", type(converter).__name__)
+        converters = self.metrics(data_class).converters
+        key = f"{field}.{name}"
+        converters[key] = converters.get(key, 0) + invocations
+
+    def observe_registry(self, registry: ConverterRegistry) -> None:
+        if all(observed is not registry for observed, _ in self._registries):
+            self._registries.append((registry, registry.cache_info()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        key_caches = key_cache_info()
+        hits = misses = 0
+        for registry, start in self._registries:
+            end = registry.cache_info()
+            hits += end.hits - start.hits
+            misses += end.misses - start.misses
+        return {
+            "data_classes": {
+                name: metrics.to_dict() for name, metrics in self.data_classes.items()
+            },
+            "caches": {
+                **{
+                    name: _cache_delta(self._key_caches[name], info)
+                    for name, info in key_caches.items()
+                },
+                "converters": _hit_rate(hits, misses),
+            },
+        }
+
+
+@contextmanager
+def instrument(observer: Optional[Observer] = None) -> Iterator[Instrumentation]:
+    instrumentation = Instrumentation(observer)
+    token = _active.set(instrumentation)
+    try:
+        yield instrumentation
+    finally:
+        _active.reset(token)
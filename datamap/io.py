@@ -0,0 +1,164 @@
+import codecs
+import json
+import os
+from mmap import mmap
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from datamap.converters import ConverterRegistry
+from datamap.dicts import Module
+from datamap.errors import MappingError
+from datamap.mappers import T
+from datamap.streams import CHUNK_SIZE, from_stream
+from datamap.validation import Validation
+
+BUFFER_SIZE = 1 << 20
+
+WHITESPACE = " \t\n\r"
+
+Source = Union[str, os.PathLike, BinaryIO, mmap]
+
+
+def _open(source: Source) -> Iterator[Union[BinaryIO, mmap]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            yield stream
+    else:
+        yield source
+
+
+def iter_ndjson(source: Source) -> Iterator[Any]:
+    decode = json.JSONDecoder().decode
+    for stream in _open(source):
+        for line in iter(stream.readline, b""):
+            line = line.strip()
+            if line:
+                yield decode(line.decode("utf-8"))
+
+
+class JsonArrayReader:
+    def __init__(self, stream: Union[BinaryIO, mmap], buffer_size: int = BUFFER_SIZE):
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def _fill(self) -> bool:
+        if self._exhausted:
+            return False
+        block = self._stream.read(self._buffer_size)
+        self._exhausted = not block
+        self._buffer = self._buffer[self._position :] + self._decoder.decode(
+            block, final=self._exhausted
+        )
+        self._position = 0
+        return True
+
+    def _peek(self, skipped: str) -> str:
+        while True:
+            buffer, position = self._buffer, self._position
+            while position < len(buffer) and buffer[position] in skipped:
+                position += 1
+            self._position = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self._fill():
+                return ""
+
+    def _decode(self) -> Any:
+        while True:
+            try:
+                value, end = self._raw_decode(self._buffer, self._position)
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            self._fill()
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _end(self) -> None:
+        self._position += 1
+        if self._peek(WHITESPACE):
+            raise self._error("Extra data")
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._peek(WHITESPACE) != "[":
+            raise self._error("Expecting '['")
+        self._position += 1
+        if self._peek(WHITESPACE) == "]":
+            self._end()
+            return
+        while True:
+            if not self._peek(WHITESPACE):
+                raise self._error("Unterminated array")
+            yield self._decode()
+            character = self._peek(WHITESPACE)
+            if character == "]":
+                self._end()
+                return
+            if not character:
+                raise self._error("Unterminated array")
+            if character != ",":
+                raise self._error("Expecting ',' delimiter")
+            self._position += 1
+
+
+def iter_json_array(source: Source, buffer_size: int = BUFFER_SIZE) -> Iterator[Any]:
+    for stream in _open(source):
+        yield from JsonArrayReader(stream, buffer_size)
+
+
+def from_json(
+    source: Source,
+    data_class: Optional[Type[T]] = None,
+    data_class_type_key: Optional[str] = None,
+    module: Optional[Module] = None,
+    flatten: bool = False,
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    lines: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    buffer_size: int = BUFFER_SIZE,
+    errors: Optional[List[MappingError]] = None,
+) -> Iterator[Union[Dict, T]]:
+    if not isinstance(source, (str, os.PathLike, mmap)) and not hasattr(source, "read"):
+        raise AttributeError(
+            f"Invalid argument type {type(source).__name__} passed as source, "
+            "expected a path or a binary stream!"
+        )
+    return from_stream(
+        iter_ndjson(source) if lines else iter_json_array(source, buffer_size),
+        data_class=data_class,
+        data_class_type_key=data_class_type_key,
+        module=module,
+        flatten=flatten,
+        rename=rename,
+        remove=remove,
+        engine=engine,
+        registry=registry,
+        record=record,
+        validation=validation,
+        chunk_size=chunk_size,
+        errors=errors,
+    )
@@ -0,0 +1,228 @@
+from abc import ABCMeta, abstractmethod
+from dataclasses import fields
+from functools import lru_cache
+from typing import (
+    Dict,
+    MutableMapping,
+    List,
+    Optional,
+    Tuple,
+    Any,
+    Type,
+    Iterable,
+    Iterator,
+    Set,
+    Callable,
+    Sequence,
+)
+
+from inflector import Inflector
+
+KEY_CACHE_SIZE = 8192
+
+PATH_SEPARATOR = "."
+
+underscore = lru_cache(maxsize=KEY_CACHE_SIZE)(Inflector().underscore)
+camelize = lru_cache(maxsize=KEY_CACHE_SIZE)(Inflector().camelize)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def merge_camel_case_keys(parent_key: str, key: str) -> str:
+    return f"{parent_key}{camelize(key)}"
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def lower_camel_case_key(key: str) -> str:
+    camel_case_key = camelize(key)
+    return f"{camel_case_key[:1].lower()}{camel_case_key[1:]}"
+
+
+def key_cache_info() -> Dict[str, Tuple[int, int, Optional[int], int]]:
+    return {
+        "underscore": underscore.cache_info(),
+        "camelize": camelize.cache_info(),
+        "merge": merge_camel_case_keys.cache_info(),
+    }
+
+
+def seed_key_cache(data_class: Type) -> None:
+    for attribute in fields(data_class):
+        camel_case_name = camelize(attribute.name)
+        underscore(attribute.name)
+        underscore(camel_case_name)
+        underscore(f"{camel_case_name[:1].lower()}{camel_case_name[1:]}")
+
+
+def pep8_compliant_keys(value: Dict, inflector: Optional[Inflector] = None) -> Dict:
+    if inflector:
+        return {inflector.underscore(key): value for key, value in value.items()}
+    return {underscore(key): value for key, value in value.items()}
+
+
+class KeyMergerStrategy(metaclass=ABCMeta):
+    @abstractmethod
+    def apply(self, parent_key: str, key: str) -> str:
+        pass
+
+
+class DefaultKeyMergerStrategy(KeyMergerStrategy):
+    def apply(self, parent_key: Optional[str], key: str) -> str:
+        if parent_key:
+            return merge_camel_case_keys(parent_key, key)
+        return key
+
+
+def squash_key(key: str) -> str:
+    return "".join(filter(str.isalnum, key.lower()))
+
+
+def path_prefixes(paths: Iterable[str]) -> Set[str]:
+    return {
+        PATH_SEPARATOR.join(keys[:length])
+        for keys in map(lambda path: path.split(PATH_SEPARATOR), paths)
+        for length in range(1, len(keys) + 1)
+    }
+
+
+def flatten_dict(
+    records: MutableMapping[Any, Any],
+    parent_key: Optional[str] = None,
+    key_merger=DefaultKeyMergerStrategy(),
+    max_depth: Optional[int] = None,
+    include_paths: Optional[Iterable[str]] = None,
+    include_key: Optional[Callable[[str], bool]] = None,
+) -> Dict:
+    included = set(include_paths) if include_paths is not None else None
+    prefixes = path_prefixes(included) if included is not None else set()
+    flattened: Dict = {}
+    stack: List[Tuple[Optional[str], Iterator[Tuple[Any, Any]], int, str, bool]] = [
+        (parent_key, iter(records.items()), 0, "", included is None)
+    ]
+    while stack:
+        prefix, items, depth, path, flatten_all = stack[-1]
+        for key, value in items:
+            new_key = key_merger.apply(prefix, key)
+            if (
+                isinstance(value, MutableMapping)
+                and (max_depth is None or depth < max_depth)
+                and (include_key is None or include_key(new_key))
+            ):
+                if flatten_all:
+                    stack.append((new_key, iter(value.items()), depth + 1, "", True))
+                    break
+                nested_path = f"{path}{PATH_SEPARATOR}{key}" if path else str(key)
+                if nested_path in prefixes:
+                    stack.append(
+                        (
+                            new_key,
+                            iter(value.items()),
+                            depth + 1,
+                            nested_path,
+                            nested_path in included,  # type: ignore
+                        )
+                    )
+                    break
+            flattened[new_key] = value
+        else:
+            stack.pop()
+    return flattened
+
+
+class KeyTable:
+    def __init__(
+        self,
+        key_mappings: Sequence[Tuple[str, str]] = (),
+        keys_to_remove: Iterable[str] = (),
+    ):
+        origins: Dict[str, Optional[str]] = {}
+        touched: Set[str] = set()
+        for old_key, new_key in key_mappings:
+            if old_key in origins:
+                origin = origins.pop(old_key)
+            else:
+                origin = None if old_key in touched else old_key
+            touched.update((old_key, new_key))
+            origins[new_key] = origin
+        removed = set(keys_to_remove)
+        self.keys: Dict[str, Optional[str]] = dict.fromkeys(touched | removed)
+        for new_key, origin in origins.items():
+            if origin is not None and new_key not in removed:
+                self.keys[origin] = new_key
+        self.defaults = tuple(key for key in origins if key not in removed)
+
+    def __call__(self, data: Dict) -> Dict:
+        if data:
+            if not isinstance(data, Dict):
+                raise AttributeError(
+                    f"Invalid argument type {type(data).__name__} passed as data, expected a dict!"
+                )
+            return self.apply(data)
+        return data
+
+    def translate(self, key: str) -> Optional[str]:
+        return self.keys.get(key, key)
+
+    def apply(
+        self, data: Dict, translate: Optional[Callable[[str], str]] = None
+    ) -> Dict:
+        keys = self.keys
+        record = {}
+        for key, value in data.items():
+            if translate is not None:
+                key = translate(key)
+            new_key = keys.get(key, key)
+            if new_key is not None:
+                record[new_key] = value
+        for key in self.defaults:
+            if key not in record:
+                record[key] = None
+        return record
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _compile_key_table(
+    key_mappings: Tuple[Tuple[str, str], ...], keys_to_remove: Tuple[str, ...]
+) -> KeyTable:
+    return KeyTable(key_mappings, keys_to_remove)
+
+
+def compile_key_table(
+    key_mappings: Sequence[Tuple[str, str]] = (), keys_to_remove: Iterable[str] = ()
+) -> KeyTable:
+    return _compile_key_table(tuple(map(tuple, key_mappings)), tuple(keys_to_remove))
+
+
+def rename_keys(data: Dict, *key_mappings, **kwargs) -> Dict:
+    if data:
+        if not isinstance(data, Dict):
+            raise AttributeError(
+                f"Invalid argument type {type(data).__name__} passed as data, expected a dict!"
+            )
+        if key_mappings:
+            if kwargs.get("suppress_none", False):
+                return _rename_keys_suppressing_none(data, key_mappings, **kwargs)
+            record = compile_key_table(key_mappings).apply(data)
+            if kwargs.get("inplace", False):
+                data.clear()
+                data.update(record)
+                return data
+            return record
+    return data
+
+
+def _rename_keys_suppressing_none(
+    data: Dict, key_mappings: Sequence[Tuple[str, str]], inplace: bool = False, **_
+) -> Dict:
+    if not inplace:
+        data = dict(data)
+    for old_key, new_key in key_mappings:
+        value = data.pop(old_key, None)
+        if value:
+            data[new_key] = value
+    return data
+
+
+def remove_keys(data: Dict, *keys_to_remove: str) -> Dict:
+    if data and keys_to_remove:
+        return compile_key_table((), keys_to_remove)(data)
+    return data
@@ -0,0 +1,556 @@
+import logging
+from dataclasses import MISSING, Field, fields
+from functools import lru_cache
+from typing import (
+    Dict,
+    Type,
+    TypeVar,
+    Generic,
+    Sequence,
+    Tuple,
+    Callable,
+    Any,
+    Union,
+    Optional,
+    Iterable,
+    List,
+)
+
+import dacite
+
+from datamap import instrumentation
+from datamap.codegen import generate_builder, is_supported, nested_data_class
+from datamap.columns import Columns, to_columns
+from datamap.converters import (
+    JSON_TYPES,
+    ConverterRegistry,
+    convert_many,
+    default_registry,
+    identity,
+)
+from datamap.errors import MappingError, locate_error, prefix_error
+from datamap.hints import type_hints
+from datamap.records import record_type
+from datamap.validation import (
+    Validation,
+    column_mismatches,
+    type_mismatches,
+    validation_of,
+)
+from datamap.keys import (
+    compile_key_table,
+    flatten_dict,
+    seed_key_cache,
+    squash_key,
+    underscore,
+)
+
+T = TypeVar("T")
+
+MAX_TRANSLATED_KEYS = 4096
+
+ENGINES = ("dacite", "codegen")
+
+
+def _columns_by_type(
+    name: str, records: List[Dict]
+) -> Dict[type, Tuple[List[Dict], List[Any]]]:
+    columns: Dict[type, Tuple[List[Dict], List[Any]]] = {}
+    for record in records:
+        if name in record:
+            value = record[name]
+            column = columns.get(type(value))
+            if column is None:
+                column = columns[type(value)] = ([], [])
+            column[0].append(record)
+            column[1].append(value)
+    return columns
+
+
+def _convert_column(
+    name: str,
+    converter: Callable[[Any], Any],
+    column_records: List[Dict],
+    values: List[Any],
+) -> None:
+    try:
+        converted = convert_many(converter, values)
+    except Exception as error:
+        if len(values) == 1:
+            locate_error(error, name, values[0])
+        else:
+            locate_error(error, name)
+        raise
+    for record, value in zip(column_records, converted):
+        record[name] = value
+
+
+class NestedConverter:
+    def __init__(self, mapper: "Mapper", many: bool, name: str):
+        self.mapper = mapper
+        self.many = many
+        self.name = name
+
+    def __call__(self, value: Any) -> Any:
+        if self.many:
+            return [
+                self._map(item, f"{self.name}[{index}]")
+                for index, item in enumerate(value)
+            ]
+        return self._map(value, self.name)
+
+    def _map(self, value: Any, path: str) -> Any:
+        if isinstance(value, Dict):
+            try:
+                return self.mapper.build(self.mapper.normalize(value))
+            except Exception as error:
+                prefix_error(error, path)
+                raise
+        return value
+
+
+class Mapper(Generic[T]):
+    def __init__(
+        self,
+        data_class: Type[T],
+        flatten: bool = False,
+        rename: Sequence[Tuple[str, str]] = (),
+        remove: Sequence[str] = (),
+        engine: str = "dacite",
+        registry: Optional[ConverterRegistry] = None,
+        record: str = "dataclass",
+        validation: Union[str, Validation] = "full",
+    ):
+        if engine not in ENGINES:
+            raise AttributeError(
+                f"Invalid engine {engine} passed, expected one of {', '.join(ENGINES)}!"
+            )
+        self.data_class = data_class
+        self.flatten = flatten
+        self.rename = tuple(rename)
+        self.remove = tuple(remove)
+        self.attributes = fields(data_class)
+        self.record = record
+        self.record_class = record_type(data_class, record)
+        self.validation = validation_of(validation)
+        self._validated = 0
+        self.registry = registry or default_registry
+        self._registry_option = registry
+        hints = type_hints(data_class)
+        self._nested = {
+            attribute.name: nested_data_class(hints[attribute.name])
+            for attribute in self.attributes
+        }
+        self.needed_keys = frozenset(
+            [attribute.name for attribute in self.attributes]
+            + [key for mapping in self.rename for key in mapping]
+        )
+        self._squashed_keys = tuple(set(map(squash_key, self.needed_keys)))
+        self.field_names = frozenset(attribute.name for attribute in self.attributes)
+        self.key_table = compile_key_table(self.rename, self.remove)
+        self._defaults = tuple(
+            key for key in self.key_table.defaults if key in self.field_names
+        )
+        self._keys: Dict[str, Optional[str]] = {}
+        self._translated = 0
+        self._subtrees: Dict[str, bool] = {}
+        self._converters: Dict[str, Dict[type, Callable[[Any], Any]]] = {
+            attribute.name: {} for attribute in self.attributes
+        }
+        self._converters_version = -1
+        check_types = self.validation.level == "full"
+        self._config = dacite.Config(check_types=check_types)
+        self._build: Callable[[Dict], T] = self._build_with_dacite
+        self._construct: Callable[[Dict], T] = self._construct_with_dacite
+        seed_key_cache(data_class)
+        self.engine = engine
+        if engine == "codegen":
+            if is_supported(data_class):
+                self._build = generate_builder(
+                    data_class,
+                    self._converters,
+                    self._resolve_converter,
+                    record_class=self.record_class,
+                    check_types=check_types,
+                    count_hits=self.registry.count_hits,
+                )
+                self._construct = generate_builder(
+                    data_class,
+                    self._converters,
+                    self._resolve_converter,
+                    convert=False,
+                    record_class=self.record_class,
+                    check_types=check_types,
+                )
+            else:
+                logging.debug(
+                    "Falling back to dacite engine for %s as it has unsupported "
+                    "dataclass fields",
+                    data_class.__name__,
+                )
+                self.engine = "dacite"
+        if self.validation.level == "sampled":
+            self._build = self._sampled(self._build)
+            self._construct = self._sampled(self._construct)
+
+    def __call__(self, data: Dict) -> Union[Dict, T]:
+        if data:
+            if not isinstance(data, Dict):
+                raise AttributeError(
+                    f"Invalid argument type {type(data).__name__} passed as data, expected a dict!"
+                )
+            metrics = instrumentation.current()
+            if metrics is not None:
+                return self._map_instrumented([data], metrics)[0]
+            return self.build(self.normalize(data))
+        return data
+
+    def normalize(self, data: Dict) -> Dict:
+        if self.flatten is True:
+            data = self._flatten(data)
+        return self._translate_keys(data)
+
+    def build(self, record: Dict) -> T:
+        if self._converters_version != self.registry.version:
+            self._index_converters()
+        metrics = instrumentation.current()
+        if metrics is not None:
+            return self._build_instrumented([record], metrics)[0]
+        return self._build(record)
+
+    def map_many(
+        self,
+        data: Iterable[Dict],
+        errors: Optional[List[MappingError]] = None,
+        start: int = 0,
+    ) -> List[Union[Dict, T]]:
+        if self._converters_version != self.registry.version:
+            self._index_converters()
+        if errors is not None:
+            return self._map_collecting(data, errors, start)
+        rows = list(data)
+        positions = [position for position, row in enumerate(rows) if row]
+        for position in positions:
+            if not isinstance(rows[position], Dict):
+                raise AttributeError(
+                    f"Invalid argument type {type(rows[position]).__name__} passed as data, "
+                    "expected a dict!"
+                )
+        metrics = instrumentation.current()
+        if metrics is not None:
+            for position, instance in zip(
+                positions,
+                self._map_instrumented(
+                    [rows[position] for position in positions], metrics
+                ),
+            ):
+                rows[position] = instance
+            return rows
+        for position in positions:
+            rows[position] = self.normalize(rows[position])
+        self.convert_many([rows[position] for position in positions])
+        for position in positions:
+            rows[position] = self._construct(rows[position])
+        return rows
+
+    def map_columns(self, data: Iterable[Dict]) -> Columns:
+        if self._converters_version != self.registry.version:
+            self._index_converters()
+        records = []
+        for row in data:
+            if row:
+                if not isinstance(row, Dict):
+                    raise AttributeError(
+                        f"Invalid argument type {type(row).__name__} passed as data, "
+                        "expected a dict!"
+                    )
+                records.append(row)
+        metrics = instrumentation.current()
+        if metrics is not None:
+            metrics.observe_registry(self.registry)
+            records = self._normalize_instrumented(records, metrics)
+            started = instrumentation.timer()
+            self.convert_many(records, metrics)
+            metrics.record(
+                self.data_class,
+                "convert",
+                instrumentation.timer() - started,
+                len(records),
+            )
+            started = instrumentation.timer()
+            self._validate_columns(records)
+            columns = to_columns(self.data_class, records)
+            metrics.record(
+                self.data_class,
+                "construct",
+                instrumentation.timer() - started,
+                len(records),
+            )
+            return columns
+        records = list(map(self.normalize, records))
+        self.convert_many(records)
+        self._validate_columns(records)
+        return to_columns(self.data_class, records)
+
+    def convert_many(
+        self,
+        records: List[Dict],
+        metrics: Optional[instrumentation.Instrumentation] = None,
+    ) -> None:
+        hits = 0
+        for attribute in self.attributes:
+            name = attribute.name
+            for value_type, (column_records, values) in _columns_by_type(
+                name, records
+            ).items():
+                converter = self._converters[name].get(value_type)
+                if converter is None:
+                    converter = self._resolve_converter(attribute, value_type)
+                else:
+                    hits += len(values)
+                if converter is not identity:
+                    if metrics is not None:
+                        metrics.count_converter(
+                            self.data_class, name, converter, len(values)
+                        )
+                    _convert_column(name, converter, column_records, values)
+        self.registry.count_hits(hits)
+
+    def _flatten(self, data: Dict) -> Dict:
+        return flatten_dict(data, include_key=self._includes_subtree)
+
+    def _translate_keys(self, data: Dict) -> Dict:
+        keys = self._keys
+        record = {}
+        for key, value in data.items():
+            new_key = keys.get(key, MISSING)
+            if new_key is MISSING:
+                new_key = self._translate(key)
+            if new_key is not None:
+                record[new_key] = value
+        for key in self._defaults:
+            if key not in record:
+                record[key] = None
+        return record
+
+    def _normalize_instrumented(
+        self, rows: List[Dict], metrics: instrumentation.Instrumentation
+    ) -> List[Dict]:
+        timer = instrumentation.timer
+        if self.flatten is True:
+            started = timer()
+            rows = list(map(self._flatten, rows))
+            metrics.record(self.data_class, "flatten", timer() - started, len(rows))
+        translated = self._translated
+        started = timer()
+        records = list(map(self._translate_keys, rows))
+        metrics.record(self.data_class, "keys", timer() - started, len(rows))
+        misses = self._translated - translated
+        metrics.count_keys(self.data_class, sum(map(len, rows)) - misses, misses)
+        return records
+
+    def _build_instrumented(
+        self, records: List[Dict], metrics: instrumentation.Instrumentation
+    ) -> List[T]:
+        timer = instrumentation.timer
+        metrics.observe_registry(self.registry)
+        started = timer()
+        self.convert_many(records, metrics)
+        metrics.record(self.data_class, "convert", timer() - started, len(records))
+        started = timer()
+        instances = list(map(self._construct, records))
+        metrics.record(self.data_class, "construct", timer() - started, len(records))
+        return instances
+
+    def _map_instrumented(
+        self, rows: List[Dict], metrics: instrumentation.Instrumentation
+    ) -> List[T]:
+        if self._converters_version != self.registry.version:
+            self._index_converters()
+        return self._build_instrumented(
+            self._normalize_instrumented(rows, metrics), metrics
+        )
+
+    def _map_collecting(
+        self, data: Iterable[Dict], errors: List[MappingError], start: int
+    ) -> List[Union[Dict, T]]:
+        metrics = instrumentation.current()
+        instances = []
+        for index, row in enumerate(data, start):
+            if not row:
+                instances.append(row)
+                continue
+            try:
+                if not isinstance(row, Dict):
+                    raise AttributeError(
+                        f"Invalid argument type {type(row).__name__} passed as data, "
+                        "expected a dict!"
+                    )
+                if metrics is not None:
+                    instances.append(self._map_instrumented([row], metrics)[0])
+                else:
+                    instances.append(self._build(self.normalize(row)))
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(MappingError.of(index, error))
+        return instances
+
+    def _sampled(self, construct: Callable[[Dict], T]) -> Callable[[Dict], T]:
+        def construct_sampled(record: Dict) -> T:
+            instance = construct(record)
+            validated, self._validated = self._validated, self._validated + 1
+            if validated % self.validation.every == 0:
+                self._validate(instance)
+            return instance
+
+        return construct_sampled
+
+    def _validate(self, instance: T) -> None:
+        for mismatch in type_mismatches(self.data_class, instance):
+            if self.validation.callback is None:
+                raise mismatch
+            self.validation.callback(instance, mismatch)
+
+    def _validate_columns(self, records: List[Dict]) -> None:
+        level, every, callback = self.validation
+        if level == "none":
+            return
+        if level == "full":
+            for _, mismatch in column_mismatches(self.data_class, records):
+                raise mismatch
+            return
+        start = -self._validated % every
+        self._validated += len(records)
+        for record, mismatch in column_mismatches(
+            self.data_class, records, start, every
+        ):
+            if callback is None:
+                raise mismatch
+            callback(record, mismatch)
+
+    def _build_with_dacite(self, record: Dict) -> T:
+        converters_index = self._converters
+        hits = 0
+        for attribute in self.attributes:
+            name = attribute.name
+            if name in record:
+                value = record[name]
+                converter = converters_index[name].get(type(value))
+                if converter is None:
+                    converter = self._resolve_converter(attribute, type(value))
+                else:
+                    hits += 1
+                try:
+                    record[name] = converter(value)
+                except Exception as error:
+                    locate_error(error, name, value)
+                    raise
+        self.registry.count_hits(hits)
+        return self._construct_with_dacite(record)
+
+    def _construct_with_dacite(self, record: Dict) -> T:
+        if self.record == "tuple":
+            instance = dacite.from_dict(
+                data_class=self.data_class, data=record, config=self._config
+            )
+            return self.record_class(
+                *[
+                    getattr(instance, attribute.name, None)
+                    for attribute in self.attributes
+                ]
+            )
+        return dacite.from_dict(
+            data_class=self.record_class, data=record, config=self._config
+        )
+
+    def _index_converters(self) -> None:
+        self._converters_version = self.registry.version
+        for attribute in self.attributes:
+            self._converters[attribute.name].clear()
+            for value_type in JSON_TYPES:
+                self._resolve_converter(attribute, value_type)
+
+    def _resolve_converter(
+        self, attribute: Field, value_type: type
+    ) -> Callable[[Any], Any]:
+        converter = self.registry.resolve(attribute, value_type)
+        nested = self._nested[attribute.name]
+        if converter is identity and nested:
+            nested_class, many = nested
+            if value_type is (list if many else dict):
+                converter = NestedConverter(
+                    compile_mapper(
+                        nested_class,
+                        engine=self.engine,
+                        registry=self._registry_option,
+                        validation=self.validation,
+                    ),
+                    many,
+                    attribute.name,
+                )
+        self._converters[attribute.name][value_type] = converter
+        return converter
+
+    def _includes_subtree(self, key: str) -> bool:
+        included = self._subtrees.get(key)
+        if included is None:
+            prefix = squash_key(key)
+            included = not self._nested.get(underscore(key)) and any(
+                squashed_key.startswith(prefix) for squashed_key in self._squashed_keys
+            )
+            if len(self._subtrees) < MAX_TRANSLATED_KEYS:
+                self._subtrees[key] = included
+        return included
+
+    def _translate(self, key: str) -> Optional[str]:
+        self._translated += 1
+        new_key = self.key_table.translate(underscore(key))
+        if new_key not in self.field_names:
+            new_key = None
+        if len(self._keys) < MAX_TRANSLATED_KEYS:
+            self._keys[key] = new_key
+        return new_key
+
+
+@lru_cache(maxsize=None)
+def _compile_mapper(
+    data_class: Type[T],
+    flatten: bool,
+    rename: Tuple[Tuple[str, str], ...],
+    remove: Tuple[str, ...],
+    engine: str,
+    registry: Optional[ConverterRegistry],
+    record: str,
+    validation: Union[str, Validation],
+) -> Mapper[T]:
+    return Mapper(
+        data_class,
+        flatten=flatten,
+        rename=rename,
+        remove=remove,
+        engine=engine,
+        registry=registry,
+        record=record,
+        validation=validation,
+    )
+
+
+def compile_mapper(
+    data_class: Type[T],
+    flatten: bool = False,
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+) -> Mapper[T]:
+    return _compile_mapper(
+        data_class,
+        flatten,
+        tuple(map(tuple, rename)),
+        tuple(remove),
+        engine,
+        registry,
+        record,
+        validation_of(validation),
+    )
@@ -0,0 +1,167 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from dacite import WrongTypeError
+
+from datamap.columns import Columns
+from datamap.converters import ConverterRegistry, default_registry
+from datamap.errors import MappingError
+from datamap.mappers import Mapper, T, compile_mapper
+from datamap.validation import Validation, type_error, validation_of
+
+PARALLEL_THRESHOLD = 10_000
+CHUNK_SIZE = 2_000
+
+_mapper: Optional[Mapper] = None
+
+_mismatches: List[Tuple[Any, Any, Any, Optional[str]]] = []
+
+
+def _initialize(
+    data_class: Type,
+    flatten: bool,
+    rename: Sequence[Tuple[str]],
+    remove: Sequence[str],
+    engine: str,
+    registry: Optional[ConverterRegistry],
+    record: str,
+    validation: Union[str, Validation],
+) -> None:
+    global _mapper  # pylint: disable=global-statement
+    _mapper = compile_mapper(
+        data_class,
+        flatten=flatten,
+        rename=rename,
+        remove=remove,
+        engine=engine,
+        registry=registry,
+        record=record,
+        validation=validation,
+    )
+
+
+def map_chunk(
+    mapper: Mapper[T],
+    offset: int,
+    rows: Sequence[Dict],
+    columnar: bool = False,
+    errors: Optional[List[MappingError]] = None,
+) -> Union[List[Union[Dict, T]], Columns]:
+    if errors is not None:
+        return mapper.map_many(rows, errors=errors, start=offset)
+    if not columnar:
+        collected: List[MappingError] = []
+        chunk = mapper.map_many(rows, errors=collected, start=offset)
+        if collected:
+            raise collected[0] from collected[0].exception
+        return chunk
+    try:
+        return mapper.map_columns(rows)
+    except Exception:  # pylint: disable=broad-except
+        for index, row in enumerate(rows):
+            try:
+                mapper.map_columns([row])
+            except Exception as error:  # pylint: disable=broad-except
+                raise MappingError.of(offset + index, error) from error
+        raise
+
+
+def _report_mismatch(instance: Any, error: WrongTypeError) -> None:
+    _mismatches.append((instance, error.field_type, error.value, error.field_path))
+
+
+def _map_chunk(
+    offset: int, rows: Sequence[Dict], columnar: bool
+) -> Tuple[
+    Union[List[Any], Columns], Optional[List[MappingError]], List[Tuple[Any, ...]]
+]:
+    _mismatches.clear()
+    errors: Optional[List[MappingError]] = None if columnar else []
+    chunk = map_chunk(_mapper, offset, rows, columnar, errors)  # type: ignore
+    mismatches = list(_mismatches)
+    _mismatches.clear()
+    return chunk, errors, mismatches
+
+
+def merge_columns(chunks: List[Columns]) -> Columns:
+    columns = chunks[0]
+    for chunk in chunks[1:]:
+        for name, column in chunk.items():
+            if isinstance(columns[name], array) and not isinstance(column, array):
+                columns[name] = columns[name].tolist()
+            columns[name].extend(column)
+    return columns
+
+
+def map_parallel(
+    data: Sequence[Dict],
+    data_class: Type[T],
+    flatten: bool = False,
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    columnar: bool = False,
+    workers: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+    threshold: int = PARALLEL_THRESHOLD,
+    errors: Optional[List[MappingError]] = None,
+) -> Union[List[Union[Dict, T]], Columns]:
+    if errors is not None and columnar:
+        raise AttributeError("Errors can't be collected for columnar output!")
+    if workers <= 1 or not data or len(data) < threshold:
+        mapper = compile_mapper(
+            data_class,
+            flatten=flatten,
+            rename=rename,
+            remove=remove,
+            engine=engine,
+            registry=registry,
+            record=record,
+            validation=validation,
+        )
+        return map_chunk(mapper, 0, data, columnar, errors)
+    if not isinstance(data, list):
+        data = list(data)
+    validation = validation_of(validation)
+    callback = validation.callback
+    if callback is not None:
+        validation = validation._replace(callback=_report_mismatch)
+    offsets = range(0, len(data), chunk_size)
+    chunks = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize,
+        initargs=(
+            data_class,
+            flatten,
+            rename,
+            remove,
+            engine,
+            registry or default_registry,
+            record,
+            validation,
+        ),
+    ) as executor:
+        for chunk, chunk_errors, mismatches in executor.map(
+            _map_chunk,
+            offsets,
+            [data[offset : offset + chunk_size] for offset in offsets],
+            [columnar] * len(offsets),
+        ):
+            chunks.append(chunk)
+            for instance, field_type, value, field_path in mismatches:
+                callback(  # type: ignore
+                    instance, type_error(field_type, value, field_path)
+                )
+            if chunk_errors:
+                if errors is None:
+                    raise chunk_errors[0]
+                errors.extend(chunk_errors)
+    if columnar:
+        return merge_columns(chunks)  # type: ignore
+    return list(chain.from_iterable(chunks))  # type: ignore
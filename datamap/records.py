@@ -0,0 +1,203 @@
+from collections import namedtuple
+from dataclasses import MISSING, Field, dataclass, field, fields
+from functools import lru_cache
+from types import CellType, FunctionType
+from typing import Any, Dict, List, Set, Tuple, Type
+
+from datamap.hints import type_hints
+
+RECORDS = ("dataclass", "slots", "frozen", "tuple")
+
+_GENERATED_ATTRIBUTES = {
+    "__dict__",
+    "__weakref__",
+    "__dataclass_fields__",
+    "__dataclass_params__",
+    "__init__",
+    "__repr__",
+    "__eq__",
+    "__hash__",
+    "__setattr__",
+    "__delattr__",
+    "__match_args__",
+    "__slots__",
+}
+
+
+def restore_record(data_class: Type, record: str, values: Tuple[Any, ...]) -> Any:
+    record_class = record_type(data_class, record)
+    if record == "tuple":
+        return record_class(*values)
+    instance = object.__new__(record_class)
+    for attribute, value in zip(fields(record_class), values):
+        object.__setattr__(instance, attribute.name, value)
+    return instance
+
+
+def _inherited_namespace(data_class: Type) -> Dict[str, Any]:
+    namespace: Dict[str, Any] = {}
+    for base in reversed(data_class.__mro__[:-1]):
+        namespace.update(
+            (name, value)
+            for name, value in vars(base).items()
+            if name not in _GENERATED_ATTRIBUTES
+        )
+    return namespace
+
+
+def _rebind_class_cell(value: Any, cells: List[CellType]) -> Any:
+    if isinstance(value, (classmethod, staticmethod)):
+        return type(value)(_rebind_class_cell(value.__func__, cells))
+    if isinstance(value, property):
+        return property(
+            *(
+                _rebind_class_cell(accessor, cells) if accessor else None
+                for accessor in (value.fget, value.fset, value.fdel)
+            ),
+            value.__doc__,
+        )
+    code = getattr(value, "__code__", None)
+    if not isinstance(value, FunctionType) or "__class__" not in code.co_freevars:
+        return value
+    closure = list(value.__closure__ or ())
+    cell = closure[code.co_freevars.index("__class__")] = CellType()
+    cells.append(cell)
+    function = FunctionType(
+        code, value.__globals__, value.__name__, value.__defaults__, tuple(closure)
+    )
+    function.__kwdefaults__ = value.__kwdefaults__
+    function.__qualname__ = value.__qualname__
+    function.__doc__ = value.__doc__
+    function.__module__ = value.__module__
+    function.__annotations__ = value.__annotations__
+    function.__dict__.update(value.__dict__)
+    return function
+
+
+def _class_namespace(
+    cls: Type, excluded: Set[str], cells: List[CellType]
+) -> Dict[str, Any]:
+    return {
+        name: _rebind_class_cell(value, cells)
+        for name, value in vars(cls).items()
+        if name not in _GENERATED_ATTRIBUTES and name not in excluded
+    }
+
+
+def _slotted_base(base: Type, excluded: Set[str], copies: Dict[Type, Type]) -> Type:
+    if base is object or "__slots__" in vars(base):
+        return base
+    if base not in copies:
+        cells: List[CellType] = []
+        namespace = _class_namespace(base, excluded, cells)
+        namespace.pop("__annotations__", None)
+        namespace["__slots__"] = ()
+        bases = tuple(
+            _slotted_base(parent, excluded, copies) for parent in base.__bases__
+        )
+        copies[base] = type(base)(base.__name__, bases, namespace)
+        for cell in cells:
+            cell.cell_contents = copies[base]
+    return copies[base]
+
+
+def _field(attribute: Field) -> Field:
+    options = {}
+    if hasattr(attribute, "kw_only"):
+        options["kw_only"] = attribute.kw_only  # type: ignore
+    return field(  # type: ignore
+        default=attribute.default,
+        default_factory=attribute.default_factory,  # type: ignore
+        init=attribute.init,
+        repr=attribute.repr,
+        hash=attribute.hash,
+        compare=attribute.compare,
+        metadata=attribute.metadata,
+        **options,
+    )
+
+
+def _slotted_data_class(data_class: Type, frozen: bool) -> Type:
+    hints = type_hints(data_class)
+    names = {attribute.name for attribute in fields(data_class)}
+    copies: Dict[Type, Type] = {}
+    bases = tuple(_slotted_base(base, names, copies) for base in data_class.__bases__)
+    cells: List[CellType] = []
+    namespace = _class_namespace(data_class, names, cells)
+    namespace["__annotations__"] = {}
+    for attribute in fields(data_class):
+        namespace["__annotations__"][attribute.name] = hints[attribute.name]
+        namespace[attribute.name] = _field(attribute)
+    params = data_class.__dataclass_params__  # type: ignore
+    generated = dataclass(
+        eq=params.eq,
+        order=params.order,
+        unsafe_hash=params.unsafe_hash,
+        frozen=frozen or params.frozen,
+    )(type(data_class.__name__, bases, namespace))
+    namespace = {
+        name: value
+        for name, value in vars(generated).items()
+        if name not in ("__dict__", "__weakref__")
+        and name not in generated.__dataclass_fields__
+    }
+    namespace["__slots__"] = tuple(generated.__dataclass_fields__)
+    namespace["__qualname__"] = data_class.__qualname__
+    record = "frozen" if frozen else "slots"
+    namespace["__reduce__"] = lambda self: (
+        restore_record,
+        (
+            data_class,
+            record,
+            tuple(getattr(self, name) for name in generated.__dataclass_fields__),
+        ),
+    )
+    record_class = type(generated)(generated.__name__, bases, namespace)
+    for cell in cells:
+        cell.cell_contents = record_class
+    return record_class
+
+
+def _tuple_record(data_class: Type) -> Type:
+    attributes = fields(data_class)
+    defaults = []
+    for attribute in reversed(attributes):
+        if attribute.default is MISSING:
+            break
+        defaults.insert(0, attribute.default)
+    base = namedtuple(  # type: ignore
+        data_class.__name__,
+        [attribute.name for attribute in attributes],
+        defaults=defaults,
+        module=data_class.__module__,
+    )
+    namespace = {
+        name: value
+        for name, value in _inherited_namespace(data_class).items()
+        if name not in data_class.__dataclass_fields__
+        and name not in ("__module__", "__doc__", "__annotations__", "__post_init__")
+    }
+    namespace.update(
+        {
+            "__slots__": (),
+            "__qualname__": data_class.__qualname__,
+            "__reduce__": lambda self: (
+                restore_record,
+                (data_class, "tuple", tuple(self)),
+            ),
+        }
+    )
+    return type(data_class.__name__, (base,), namespace)
+
+
+@lru_cache(maxsize=None)
+def record_type(data_class: Type, record: str = "dataclass") -> Type:
+    if record not in RECORDS:
+        raise AttributeError(
+            f"Invalid record {record} passed, expected one of {', '.join(RECORDS)}!"
+        )
+    if record == "dataclass":
+        return data_class
+    if record == "tuple":
+        return _tuple_record(data_class)
+    return _slotted_data_class(data_class, frozen=record == "frozen")
@@ -0,0 +1,216 @@
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from datamap.keys import (
+    PATH_SEPARATOR,
+    DefaultKeyMergerStrategy,
+    KeyMergerStrategy,
+    lower_camel_case_key,
+)
+from datamap.mappers import T
+from datamap.time import to_timestamp
+
+serializers: Dict[type, Callable[[Any], Any]] = {
+    datetime: to_timestamp,
+    Enum: lambda value: value.value,
+}
+
+
+def register_serializer(value_type: type, serializer: Callable[[Any], Any]) -> None:
+    serializers[value_type] = serializer
+    _serialize_value.cache_clear()
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _serialize_items(values: Iterable[Any]) -> List[Any]:
+    return [_serialize_value(type(value))(value) for value in values]
+
+
+@lru_cache(maxsize=None)
+def _serialize_value(value_type: type) -> Callable[[Any], Any]:
+    if is_dataclass(value_type):
+        return compile_serializer(value_type).serialize
+    if issubclass(value_type, (list, tuple, set, frozenset)):
+        return _serialize_items
+    for base_type in value_type.__mro__:
+        if base_type in serializers:
+            return serializers[base_type]
+    return _identity
+
+
+def key_path(
+    key: str,
+    unflatten: Sequence[str],
+    key_merger: KeyMergerStrategy = DefaultKeyMergerStrategy(),
+) -> Tuple[str, ...]:
+    merged_paths = {}
+    for path in unflatten:
+        merged_key = None
+        for path_key in path.split(PATH_SEPARATOR):
+            merged_key = key_merger.apply(merged_key, path_key)
+        merged_paths[path] = merged_key
+    for path in sorted(unflatten, key=len, reverse=True):
+        parent_key = merged_paths[path]
+        if key.startswith(parent_key) and len(key) > len(parent_key):
+            child_key = key[len(parent_key) :]
+            child_key = f"{child_key[:1].lower()}{child_key[1:]}"
+            if key_merger.apply(parent_key, child_key) == key:
+                return tuple(path.split(PATH_SEPARATOR)) + (child_key,)
+    return (key,)
+
+
+class Serializer(Generic[T]):
+    def __init__(
+        self,
+        data_class: Type[T],
+        unflatten: Sequence[str] = (),
+        rename: Sequence[Tuple[str, str]] = (),
+        remove: Sequence[str] = (),
+        suppress_none: bool = False,
+    ):
+        self.data_class = data_class
+        self.unflatten = tuple(unflatten)
+        self.rename = tuple(rename)
+        self.remove = tuple(remove)
+        self.suppress_none = suppress_none
+        self.keys: List[Tuple[str, Tuple[str, ...]]] = []
+        for attribute in fields(data_class):
+            if attribute.name in self.remove:
+                continue
+            key = attribute.name
+            for old_key, new_key in reversed(self.rename):
+                if key == new_key:
+                    key = old_key
+            self.keys.append(
+                (attribute.name, key_path(lower_camel_case_key(key), self.unflatten))
+            )
+
+    def __call__(self, instance: T) -> Dict:
+        if not isinstance(instance, self.data_class):
+            raise AttributeError(
+                f"Invalid argument type {type(instance).__name__} passed as data, "
+                f"expected a {self.data_class.__name__}!"
+            )
+        return self.serialize(instance)
+
+    def serialize(self, instance: T) -> Dict:
+        data: Dict = {}
+        for name, path in self.keys:
+            value = getattr(instance, name)
+            if value is None:
+                if self.suppress_none:
+                    continue
+            else:
+                value = _serialize_value(type(value))(value)
+            if len(path) == 1:
+                data[path[0]] = value
+                continue
+            parent = data
+            for key in path[:-1]:
+                parent = parent.setdefault(key, {})
+            parent[path[-1]] = value
+        return data
+
+
+@lru_cache(maxsize=None)
+def _compile_serializer(
+    data_class: Type[T],
+    unflatten: Tuple[str, ...],
+    rename: Tuple[Tuple[str, str], ...],
+    remove: Tuple[str, ...],
+    suppress_none: bool,
+) -> Serializer[T]:
+    return Serializer(
+        data_class,
+        unflatten=unflatten,
+        rename=rename,
+        remove=remove,
+        suppress_none=suppress_none,
+    )
+
+
+def compile_serializer(
+    data_class: Type[T],
+    unflatten: Sequence[str] = [],
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    suppress_none: bool = False,
+) -> Serializer[T]:
+    return _compile_serializer(
+        data_class,
+        tuple(unflatten),
+        tuple(map(tuple, rename)),
+        tuple(remove),
+        suppress_none,
+    )
+
+
+def _serialize(
+    instance: Any, options: Tuple[Tuple[str, ...], Tuple, Tuple[str, ...], bool]
+) -> Optional[Dict]:
+    if instance is None:
+        return instance
+    if not is_dataclass(instance) or isinstance(instance, type):
+        raise AttributeError(
+            f"Invalid argument type {type(instance).__name__} passed as data, "
+            "expected a dataclass instance!"
+        )
+    return _compile_serializer(type(instance), *options).serialize(instance)
+
+
+def _options(
+    unflatten: Sequence[str],
+    rename: Sequence[Tuple[str]],
+    remove: Sequence[str],
+    suppress_none: bool,
+) -> Tuple[Tuple[str, ...], Tuple, Tuple[str, ...], bool]:
+    return tuple(unflatten), tuple(map(tuple, rename)), tuple(remove), suppress_none
+
+
+def to_dict(
+    instance: T,
+    unflatten: Sequence[str] = [],
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    suppress_none: bool = False,
+) -> Optional[Dict]:
+    return _serialize(instance, _options(unflatten, rename, remove, suppress_none))
+
+
+def to_dicts(
+    instances: Union[T, Iterable[T]],
+    unflatten: Sequence[str] = [],
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    suppress_none: bool = False,
+) -> Union[Optional[Dict], List[Optional[Dict]], Iterator[Optional[Dict]]]:
+    options = _options(unflatten, rename, remove, suppress_none)
+    if instances is None or is_dataclass(instances):
+        return _serialize(instances, options)
+    if isinstance(instances, (list, tuple)):
+        return [_serialize(instance, options) for instance in instances]
+    if isinstance(instances, Iterable):
+        return (_serialize(instance, options) for instance in instances)
+    raise AttributeError(
+        f"Invalid argument type {type(instances).__name__} passed as data, "
+        "expected a dataclass instance or an iterable!"
+    )
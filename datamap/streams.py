@@ -0,0 +1,152 @@
+from contextvars import copy_context
+from itertools import chain, count
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from more_itertools import chunked
+
+from datamap.converters import ConverterRegistry
+from datamap.dicts import Module, from_dict
+from datamap.errors import MappingError
+from datamap.mappers import T, compile_mapper
+from datamap.validation import Validation
+
+CHUNK_SIZE = 1_000
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def flatten_pages(data: Iterable[Any]) -> Iterator[Dict]:
+    for item in data:
+        if isinstance(item, (Dict, str, bytes)) or not isinstance(item, Iterable):
+            yield item
+        else:
+            yield from flatten_pages(item)
+
+
+class Prefetcher:
+    def __init__(self, chunks: Iterator[List[Any]], prefetch: int):
+        self._chunks = chunks
+        self._queue: Queue = Queue(maxsize=prefetch)
+        self._stopped = Event()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            for chunk in self._chunks:
+                if not self._put(chunk):
+                    return
+        except BaseException as error:  # pylint: disable=broad-except
+            self._put(_Failure(error))
+            return
+        self._put(_DONE)
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        Thread(
+            target=copy_context().run,
+            args=(self._produce,),
+            name="datamap-prefetch",
+            daemon=True,
+        ).start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            self._stopped.set()
+
+
+def from_stream(
+    data: Iterable[Union[Dict, Iterable[Dict]]],
+    data_class: Optional[Type[T]] = None,
+    data_class_type_key: Optional[str] = None,
+    module: Optional[Module] = None,
+    flatten: bool = False,
+    rename: Sequence[Tuple[str]] = [],
+    remove: Sequence[str] = [],
+    engine: str = "dacite",
+    registry: Optional[ConverterRegistry] = None,
+    record: str = "dataclass",
+    validation: Union[str, Validation] = "full",
+    chunk_size: int = CHUNK_SIZE,
+    prefetch: int = 0,
+    errors: Optional[List[MappingError]] = None,
+) -> Iterator[Union[Dict, T]]:
+    if isinstance(data, Dict) or not isinstance(data, Iterable):
+        raise AttributeError(
+            f"Invalid argument type {type(data).__name__} passed as data, expected an iterable!"
+        )
+    if errors is not None and not data_class:
+        raise AttributeError(
+            "Collecting errors requires a data_class, it can't be resolved from a module!"
+        )
+    if data_class:
+        mapper = compile_mapper(
+            data_class,
+            flatten=flatten,
+            rename=rename,
+            remove=remove,
+            engine=engine,
+            registry=registry,
+            record=record,
+            validation=validation,
+        )
+        if errors is not None:
+            chunks = map(
+                lambda offset, rows: mapper.map_many(rows, errors=errors, start=offset),
+                count(0, chunk_size),
+                chunked(flatten_pages(data), chunk_size),
+            )
+        else:
+            chunks = map(mapper.map_many, chunked(flatten_pages(data), chunk_size))
+    else:
+        chunks = map(
+            lambda rows: [
+                from_dict(
+                    data=row,
+                    data_class_type_key=data_class_type_key,
+                    module=module,
+                    flatten=flatten,
+                    rename=rename,
+                    remove=remove,
+                    engine=engine,
+                    registry=registry,
+                    record=record,
+                    validation=validation,
+                )
+                for row in rows
+            ],
+            chunked(flatten_pages(data), chunk_size),
+        )
+    if prefetch > 0:
+        chunks = iter(Prefetcher(chunks, prefetch))
+    return chain.from_iterable(chunks)
@@ -1,10 +1,134 @@
-from datetime import datetime
+from dataclasses import Field
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional
+
+MAX_TIMESTAMP_IN_SECONDS = 253402300799
+MAX_TIMESTAMP_IN_MILLISECONDS = MAX_TIMESTAMP_IN_SECONDS * 1_000
+
+UNITS = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _is_timestamp(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def detect_unit(value: float) -> str:
+    magnitude = abs(value)
+    for unit, scale in UNITS.items():
+        if magnitude <= MAX_TIMESTAMP_IN_SECONDS * scale:
+            return unit
+    return "ns"
+
+
+@lru_cache(maxsize=None)
+def timestamp_function(
+    unit: str, tz: Optional[tzinfo] = None
+) -> Callable[[float], datetime]:
+    scale = UNITS[unit]
+    fromtimestamp = datetime.fromtimestamp
+    if scale <= UNITS["ms"]:
+        return lambda value: fromtimestamp(value / scale, tz)
+    microseconds = scale // UNITS["us"]
+    if tz is None:
+        return lambda value: (
+            (EPOCH + timedelta(microseconds=value // microseconds))
+            .astimezone()
+            .replace(tzinfo=None)
+        )
+    return lambda value: (
+        EPOCH + timedelta(microseconds=value // microseconds)
+    ).astimezone(tz)
+
+
+class TimestampConverter:
+    def __init__(self, unit: Optional[str] = None, tz: Optional[tzinfo] = None):
+        if unit is not None and unit not in UNITS:
+            raise AttributeError(
+                f"Invalid unit {unit} passed, expected one of {', '.join(UNITS)}!"
+            )
+        self.unit = unit
+        self.tz = tz
+        self._convert = timestamp_function(unit, tz) if unit else None
+        self._limit = float("inf")
+
+    def bind(self, attribute: Field) -> "TimestampConverter":
+        if self.unit is None:
+            return TimestampConverter(tz=self.tz)
+        return self
+
+    def _detect(self, value: float) -> Callable[[float], datetime]:
+        self.unit = detect_unit(value)
+        self._convert = timestamp_function(self.unit, self.tz)
+        self._limit = MAX_TIMESTAMP_IN_SECONDS * UNITS[self.unit]
+        return self._convert
+
+    def __call__(self, value: Any) -> Any:
+        if _is_timestamp(value):
+            if self._convert is None or abs(value) > self._limit:
+                return self._detect(value)(value)
+            return self._convert(value)
+        return value
+
+    def convert_many(self, values: Iterable[Any]) -> List[Any]:
+        values = list(values)
+        if self._convert is None:
+            first = next(filter(_is_timestamp, values), None)
+            if first is None:
+                return values
+            self._detect(first)
+        convert, limit = self._convert, self._limit
+        converted = []
+        for value in values:
+            if not _is_timestamp(value):
+                converted.append(value)
+            elif abs(value) <= limit:
+                converted.append(convert(value))  # type: ignore
+            else:
+                converted.append(self._detect(value)(value))
+                convert, limit = self._convert, self._limit
+        return converted
+
+
+def _parse_timestamp(value: int) -> datetime:
+    if abs(value) > MAX_TIMESTAMP_IN_SECONDS:
+        if abs(value) > MAX_TIMESTAMP_IN_MILLISECONDS:
+            return timestamp_function(detect_unit(value))(value)
+        return datetime.fromtimestamp(value / 1e3)
+    return datetime.fromtimestamp(value)
 
 
 def parse_timestamp(value: int) -> datetime:
     if isinstance(value, int):
-        try:
-            return datetime.fromtimestamp(value)
-        except (OSError, ValueError):
-            return datetime.fromtimestamp(value / 1e3)
+        return _parse_timestamp(value)
     return value
+
+
+def parse_timestamps(values: Iterable[Any]) -> List[Any]:
+    values = list(values)
+    fromtimestamp = datetime.fromtimestamp
+    if all(
+        abs(value) <= MAX_TIMESTAMP_IN_MILLISECONDS
+        for value in values
+        if isinstance(value, int)
+    ):
+        return [
+            (
+                fromtimestamp(value / 1e3)
+                if abs(value) > MAX_TIMESTAMP_IN_SECONDS
+                else fromtimestamp(value)
+            )
+            if isinstance(value, int)
+            else value
+            for value in values
+        ]
+    return list(map(parse_timestamp, values))
+
+
+def to_timestamp(value: datetime) -> int:
+    return round(value.timestamp() * 1e3)
+
+
+parse_timestamp.convert_many = parse_timestamps  # type: ignore
@@ -0,0 +1,103 @@
+from dataclasses import MISSING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from dacite.exceptions import UnionMatchError, WrongTypeError
+from dacite.types import is_instance, is_optional
+
+from datamap.hints import field_types
+
+LEVELS = ("full", "sampled", "none")
+
+SAMPLE_RATE = 100
+
+MismatchCallback = Callable[[Any, WrongTypeError], None]
+
+
+class Validation(NamedTuple):
+    level: str = "full"
+    every: int = SAMPLE_RATE
+    callback: Optional[MismatchCallback] = None
+
+
+def validation_of(validation: Any) -> Validation:
+    if isinstance(validation, str):
+        validation = Validation(validation)
+    if not isinstance(validation, Validation) or validation.level not in LEVELS:
+        level = getattr(validation, "level", validation)
+        raise AttributeError(
+            f"Invalid validation {level} passed, expected one of {', '.join(LEVELS)}!"
+        )
+    if validation.every < 1:
+        raise AttributeError(
+            f"Invalid sample rate {validation.every} passed, expected a positive number!"
+        )
+    return validation
+
+
+def type_error(field_type: Any, value: Any, field_path: str) -> WrongTypeError:
+    if get_origin(field_type) is Union and not (
+        is_optional(field_type) and len(get_args(field_type)) == 2
+    ):
+        return UnionMatchError(
+            field_type=field_type, value=value, field_path=field_path
+        )
+    return WrongTypeError(field_type=field_type, value=value, field_path=field_path)
+
+
+def type_mismatches(data_class: Type, instance: Any) -> List[WrongTypeError]:
+    mismatches = []
+    for name, field_type in field_types(data_class).items():
+        value = getattr(instance, name, MISSING)
+        if isinstance(field_type.type, str) or value is MISSING:
+            continue
+        if not is_instance(value, field_type.type):
+            mismatches.append(type_error(field_type.type, value, name))
+    return mismatches
+
+
+def _is_plain_type(type_: Any) -> bool:
+    return isinstance(type_, type) and get_origin(type_) is None and not get_args(type_)
+
+
+def instance_types(type_: Any) -> Optional[Union[type, Tuple[type, ...]]]:
+    if _is_plain_type(type_):
+        return type_
+    if get_origin(type_) is Union and all(map(_is_plain_type, get_args(type_))):
+        return get_args(type_)
+    return None
+
+
+def type_check(type_: Any) -> Callable[[Any], bool]:
+    if type_ is Any:
+        return lambda value: True
+    types = instance_types(type_)
+    if types is not None:
+        return lambda value: isinstance(value, types)
+    return lambda value: is_instance(value, type_)
+
+
+def column_mismatches(
+    data_class: Type, records: List[Dict], start: int = 0, every: int = 1
+) -> Iterator[Tuple[Dict, WrongTypeError]]:
+    sampled = records[start::every]
+    for name, field_type in field_types(data_class).items():
+        if isinstance(field_type.type, str):
+            continue
+        check = type_check(field_type.type)
+        for record in sampled:
+            value = record.get(name, MISSING)
+            if value is not MISSING and not check(value):
+                yield record, type_error(field_type.type, value, name)
@@ -4,9 +4,11 @@ from . import quality
 from . import nb
 from . import docs
 from . import test
+from . import bench
 
 ns = Collection()
 ns.add_collection(quality, name="qa")
 ns.add_collection(nb)
 ns.add_collection(docs)
-ns.add_collection(test)
\ No newline at end of file
+ns.add_collection(test)
+ns.add_collection(bench)
\ No newline at end of file
@@ -0,0 +1,29 @@
+from invoke import task
+
+BENCHMARKS = "tests.benchmarks"
+
+
+@task(
+    help={
+        "case": "Only run the given benchmark case, can be repeated.",
+        "rows": "Number of rows of the collection and streaming cases.",
+        "tolerance": "Allowed throughput drop compared to the baseline.",
+        "strict": "Fail when a case drops more than the tolerance.",
+    },
+    iterable=["case"],
+    default=True,
+)
+def run(c, case=None, rows=100_000, tolerance=0.3, strict=False):
+    """Run benchmarks and compare them against the stored baseline."""
+    cases = " ".join(f"--case {name}" for name in case or [])
+    strict_flag = "--strict" if strict else ""
+    c.run(
+        f"poetry run python -m {BENCHMARKS} --rows {rows} --tolerance {tolerance} "
+        f"{strict_flag} {cases}"
+    )
+
+
+@task(help={"rows": "Number of rows of the collection and streaming cases."})
+def baseline(c, rows=100_000):
+    """Run benchmarks and store the results as the new baseline."""
+    c.run(f"poetry run python -m {BENCHMARKS} --rows {rows} --save")
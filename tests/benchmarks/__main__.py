@@ -0,0 +1,50 @@
+import sys
+from argparse import ArgumentParser
+
+from tests.benchmarks.cases import cases
+from tests.benchmarks.runner import (
+    BASELINE,
+    compare,
+    load_baseline,
+    regressions,
+    report,
+    run,
+    save_baseline,
+)
+
+
+def main() -> int:
+    parser = ArgumentParser(prog="python -m tests.benchmarks")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--case", action="append", default=[])
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--strict", action="store_true")
+    parser.add_argument("--save", action="store_true")
+    arguments = parser.parse_args()
+
+    selected = [
+        case
+        for case in cases(arguments.rows)
+        if not arguments.case or case.name in arguments.case
+    ]
+    results = run(selected, arguments.repeat)
+    comparisons = compare(results, load_baseline(arguments.baseline))
+    print(report(comparisons))
+    if arguments.save:
+        save_baseline(results, arguments.baseline)
+        print(f"\nBaseline saved to {arguments.baseline}")
+        return 0
+    failed = regressions(comparisons, arguments.tolerance)
+    for comparison in failed:
+        print(
+            f"\nRegression in {comparison.result.name}: "
+            f"{comparison.ratio:.2f}x of baseline throughput",
+            file=sys.stderr,
+        )
+    return 1 if failed and arguments.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
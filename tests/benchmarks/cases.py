@@ -0,0 +1,118 @@
+from dataclasses import fields
+from datetime import datetime
+from itertools import cycle, islice
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, get_type_hints
+
+from datamap.converters import convert_attributes
+from datamap.dicts import flatten_dict, from_dict, from_dicts, pep8_compliant_keys
+from datamap.keys import lower_camel_case_key
+from datamap.streams import from_stream
+from tests.unit.fixtures.date_attributes import DateAttribute, get_date_attribute
+from tests.unit.fixtures.mentions import Mentions
+from tests.unit.fixtures.relations import Relation
+from tests.unit.fixtures.tags import Tag, get_tags
+
+TAG_OPTIONS = dict(
+    rename=[("is_smarttag", "is_smart_tag"), ("visible", "is_visible")],
+    remove=["category_model_tag"],
+)
+
+DEPTH = 12
+
+PAGE_SIZE = 500
+
+
+class Case(NamedTuple):
+    name: str
+    rows: int
+    run: Callable[[], Any]
+
+
+def date_attribute() -> Dict:
+    return get_date_attribute.__wrapped__()
+
+
+def tags() -> List[Dict]:
+    return [tag for page in get_tags.__wrapped__() for tag in page]
+
+
+def mention() -> Dict:
+    values = {str: "46283_43769358878509009", int: 3313939576, datetime: 1668629719}
+    return {
+        lower_camel_case_key(name): values[type_.__args__[0]]
+        for name, type_ in get_type_hints(Mentions).items()
+    }
+
+
+def deeply_nested(depth: int = DEPTH) -> Dict:
+    data: Dict = {"id": "leaf", "name": "leaf"}
+    for level in range(depth):
+        data = {"id": str(level), "name": f"level {level}", "child": data}
+    return data
+
+
+def relation() -> Dict:
+    asset = {"id": "2", "displayName": "source", "type": {"id": "3", "name": "Table"}}
+    return {"id": "1", "source": asset, "targets": [asset] * 8}
+
+
+def collection(rows: int) -> List[Dict]:
+    return list(islice(cycle(tags()), rows))
+
+
+def pages(rows: int) -> Iterator[List[Dict]]:
+    page = collection(PAGE_SIZE)
+    for _ in range(rows // PAGE_SIZE):
+        yield page
+
+
+def cases(rows: int) -> List[Case]:
+    date_attribute_data = date_attribute()
+    mention_data = mention()
+    nested_data = deeply_nested()
+    relation_data = relation()
+    collection_data = collection(rows)
+    converted = pep8_compliant_keys(flatten_dict(date_attribute_data))
+    date_attribute_fields = fields(DateAttribute)
+    return [
+        Case(
+            "single_record",
+            1,
+            lambda: from_dict(
+                date_attribute_data, data_class=DateAttribute, flatten=True
+            ),
+        ),
+        Case(
+            "wide_record",
+            1,
+            lambda: from_dict(mention_data, data_class=Mentions),
+        ),
+        Case("deeply_nested_flatten", 1, lambda: flatten_dict(nested_data)),
+        Case(
+            "deeply_nested_data_class",
+            1,
+            lambda: from_dict(relation_data, data_class=Relation),
+        ),
+        Case(
+            "pep8_compliant_keys",
+            1,
+            lambda: pep8_compliant_keys(mention_data),
+        ),
+        Case(
+            "convert_attributes",
+            1,
+            lambda: convert_attributes(date_attribute_fields, converted),
+        ),
+        Case(
+            "collection",
+            len(collection_data),
+            lambda: from_dicts(collection_data, data_class=Tag, **TAG_OPTIONS),
+        ),
+        Case(
+            "streaming_iterable",
+            rows // PAGE_SIZE * PAGE_SIZE,
+            lambda: sum(
+                1 for _ in from_stream(pages(rows), data_class=Tag, **TAG_OPTIONS)
+            ),
+        ),
+    ]
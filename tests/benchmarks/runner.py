@@ -0,0 +1,145 @@
+import gc
+import json
+import os
+import platform
+import tracemalloc
+from statistics import median
+from time import perf_counter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from tests.benchmarks.cases import Case
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+MIN_DURATION = 0.2
+
+CALIBRATION_ROWS = 256
+
+
+def _calibrate() -> Dict[str, str]:
+    return {f"key_{index}": str(index).upper() for index in range(CALIBRATION_ROWS)}
+
+
+CALIBRATION = Case("calibration", CALIBRATION_ROWS, _calibrate)
+
+
+class Result(NamedTuple):
+    name: str
+    rows_per_second: float
+    peak_kib: float
+    relative: float = 0.0
+
+
+class Comparison(NamedTuple):
+    result: Result
+    baseline: Optional[Result]
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.baseline and self.baseline.relative:
+            return self.result.relative / self.baseline.relative
+        return None
+
+
+def _loops(case: Case) -> int:
+    loops = 1
+    while True:
+        started = perf_counter()
+        for _ in range(loops):
+            case.run()
+        if perf_counter() - started >= MIN_DURATION:
+            return loops
+        loops *= 2
+
+
+def measure(case: Case, repeat: int = 5) -> Result:
+    case.run()
+    loops = _loops(case)
+    durations = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = perf_counter()
+            for _ in range(loops):
+                case.run()
+            durations.append((perf_counter() - started) / loops)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    tracemalloc.start()
+    try:
+        case.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(case.name, case.rows / median(durations), peak / 1024)
+
+
+def run(cases: Iterable[Case], repeat: int = 5) -> List[Result]:
+    results = []
+    for case in cases:
+        before = measure(CALIBRATION, repeat).rows_per_second
+        result = measure(case, repeat)
+        after = measure(CALIBRATION, repeat).rows_per_second
+        results.append(
+            result._replace(relative=result.rows_per_second * 2 / (before + after))
+        )
+    return results
+
+
+def load_baseline(path: str = BASELINE) -> Dict[str, Result]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return {
+            name: Result(name, **values)
+            for name, values in json.load(file)["results"].items()
+        }
+
+
+def save_baseline(results: Iterable[Result], path: str = BASELINE) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": {
+                    result.name: {
+                        "rows_per_second": round(result.rows_per_second, 1),
+                        "peak_kib": round(result.peak_kib, 1),
+                        "relative": round(result.relative, 6),
+                    }
+                    for result in results
+                },
+            },
+            file,
+            indent=2,
+        )
+        file.write("\n")
+
+
+def compare(results: Iterable[Result], baseline: Dict[str, Result]) -> List[Comparison]:
+    return [Comparison(result, baseline.get(result.name)) for result in results]
+
+
+def regressions(
+    comparisons: Iterable[Comparison], tolerance: float
+) -> List[Comparison]:
+    return [
+        comparison
+        for comparison in comparisons
+        if comparison.ratio is not None and comparison.ratio < 1 - tolerance
+    ]
+
+
+def report(comparisons: Iterable[Comparison]) -> str:
+    lines = [f"{'case':<26}{'rows/s':>14}{'peak KiB':>12}{'baseline':>10}"]
+    for comparison in comparisons:
+        result = comparison.result
+        ratio = f"{comparison.ratio:.2f}x" if comparison.ratio is not None else "-"
+        lines.append(
+            f"{result.name:<26}{result.rows_per_second:>14,.0f}"
+            f"{result.peak_kib:>12,.1f}{ratio:>10}"
+        )
+    return "\n".join(lines)
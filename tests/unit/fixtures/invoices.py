@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Union
+
+
+@dataclass
+class Invoice:
+    id: int
+    amount: Union[Decimal, None]
+    lines: Optional[Dict[str, List[int]]] = None
+    issued_on: Optional[datetime] = None
+
+
+@dataclass
+class CreditNote:
+    id: int
+    amount: Union[Decimal, None]
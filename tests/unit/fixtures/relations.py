@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class AssetType:
+    id: str
+    name: str
+
+
+@dataclass
+class Asset:
+    id: str
+    type: AssetType
+    display_name: Optional[str] = None
+
+
+@dataclass
+class Relation:
+    id: str
+    source: Asset
+    targets: List[Asset]
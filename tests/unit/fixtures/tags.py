@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Optional, Dict
 
-from datamap.decorators import datamap, rename_dict_keys, remove_dict_keys
+from datamap.decorators import datamap, rename_dict_keys, remove_dict_keys, datastream
 
 
 @dataclass
@@ -54,6 +54,46 @@ def get_tags():
                  ])
 
 
+@datastream(Tag, rename=[("is_smarttag", "is_smart_tag"), ("visible", "is_visible")], remove=["category_model_tag"],
+            chunk_size=3)
+def stream_tags():
+    return iter([[{"tag": "(LANGUAGE)",
+                   "id": 35792,
+                   "is_smarttag": False,
+                   "color_code": "rgb(83,146,255)",
+                   "filter": "usertag:\"(LANGUAGE)\"",
+                   "visible": True,
+                   "category_model_tag": False
+                   },
+                  {"tag": "2019 We Are Infrabel - Wave 1",
+                   "id": 7956854,
+                   "parent_id": 7956853,
+                   "is_smarttag": False,
+                   "color_code": "rgb(250,163,56)",
+                   "filter": "usertag:\"2019 We Are Infrabel - Wave 1\"",
+                   "visible": False,
+                   "category_model_tag": False
+                   }],
+                 [{"tag": "3ième voie Bruges-Dudzele",
+                   "id": 4557288,
+                   "is_smarttag": False,
+                   "color_code": "rgb(201,78,157)",
+                   "filter": "usertag:\"3ième voie Bruges-Dudzele\"",
+                   "visible": False,
+                   "category_model_tag": False
+                   },
+                  {"tag": "_Info Search",
+                   "id": 300976,
+                   "parent_id": 7956853,
+                   "is_smarttag": False,
+                   "color_code": "rgb(122,140,64)",
+                   "filter": "usertag:\"_Info Search\"",
+                   "visible": False,
+                   "category_model_tag": False
+                   }],
+                 ])
+
+
 @remove_dict_keys("category_model_tag")
 @rename_dict_keys(("is_smarttag", "is_smart_tag"), ("visible", "is_visible"))
 def validate_tag(data: Dict, validate: bool) -> Dict:
@@ -73,3 +113,17 @@ def get_tag() -> Dict:
             "visible": True,
             "category_model_tag": False
             }
+
+
+@datamap(Tag, rename=[("visible", "is_visible")])
+async def get_tags_async():
+    return [{"tag": "(LANGUAGE)", "id": 35792, "color_code": "rgb(83,146,255)", "filter": "usertag:\"(LANGUAGE)\"",
+             "visible": True}]
+
+
+@datamap(Tag, rename=[("visible", "is_visible")])
+async def iterate_tags_async():
+    yield [{"tag": "(LANGUAGE)", "id": 35792, "color_code": "rgb(83,146,255)", "filter": "usertag:\"(LANGUAGE)\"",
+            "visible": True}]
+    yield {"tag": "_Info Search", "id": 300976, "color_code": "rgb(122,140,64)", "filter": "usertag:\"_Info Search\"",
+           "visible": False}
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from assertpy import assert_that
+
+from datamap.aio import from_async_iterable, from_dicts_async
+from datamap.converters import ConverterRegistry, default_registry
+from tests.unit.fixtures.tags import Tag, get_tags_async, iterate_tags_async
+
+TAG = {"tag": "(LANGUAGE)", "id": 35792, "colorCode": "rgb(83,146,255)", "filter": "usertag:\"(LANGUAGE)\""}
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+async def pages():
+    yield [TAG]
+    yield [TAG, TAG]
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1, thread_name_prefix="mapping")
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+async def numbered_pages(count):
+    for _ in range(count):
+        yield [TAG]
+
+
+class AsyncTestCase(unittest.TestCase):
+    def test_from_dicts_async(self):
+        actual = asyncio.run(from_dicts_async(TAG, data_class=Tag))
+
+        assert_that(actual).is_equal_to(Tag(id=35792, tag="(LANGUAGE)", filter="usertag:\"(LANGUAGE)\"",
+                                            color_code="rgb(83,146,255)"))
+
+    def test_from_dicts_async_in_executor(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            actual = asyncio.run(from_dicts_async([TAG, TAG], data_class=Tag, executor=executor))
+
+        assert_that(actual).is_length(2)
+        assert_that(actual[1]).is_type_of(Tag)
+
+    def test_from_async_iterable(self):
+        actual = asyncio.run(collect(from_async_iterable(pages(), data_class=Tag)))
+
+        assert_that(actual).is_length(2)
+        assert_that(actual[1]).is_length(2)
+        assert_that(actual[1][0]).is_type_of(Tag)
+
+    def test_from_async_iterable_when_illegal_argument(self):
+        with self.assertRaises(AttributeError) as context:
+            from_async_iterable([TAG], data_class=Tag)
+
+        assert_that(str(context.exception)).is_equal_to(
+            "Invalid argument type list passed as data, expected an async iterable!"
+        )
+
+    def test_datamap_with_coroutine(self):
+        actual = asyncio.run(get_tags_async())
+
+        assert_that(actual).is_length(1)
+        assert_that(actual[0].is_visible).is_true()
+
+    def test_datamap_with_async_generator(self):
+        actual = asyncio.run(collect(iterate_tags_async()))
+
+        assert_that(actual[0][0].id).is_equal_to(35792)
+        assert_that(actual[1]).is_type_of(Tag)
+        assert_that(actual[1].is_visible).is_false()
+
+    def test_from_dicts_async_maps_iterables_inside_executor(self):
+        threads = []
+        registry = ConverterRegistry(parent=default_registry)
+        registry.register(int, int, lambda value: threads.append(threading.current_thread().name) or value)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mapping") as executor:
+            actual = asyncio.run(from_dicts_async(iter([[TAG], [TAG]]), data_class=Tag, registry=registry,
+                                                  executor=executor))
+
+        assert_that(actual).is_instance_of(list).is_length(2)
+        assert_that(threads).is_length(2)
+        assert_that(all(name.startswith("mapping") for name in threads)).is_true()
+
+    def test_from_async_iterable_maps_items_in_chunks_inside_executor(self):
+        with CountingExecutor() as executor:
+            actual = asyncio.run(collect(from_async_iterable(numbered_pages(5), data_class=Tag, executor=executor,
+                                                             chunk_size=2)))
+
+        assert_that(actual).is_length(5)
+        assert_that(actual[4][0]).is_type_of(Tag)
+        assert_that(executor.submitted).is_equal_to(3)
@@ -0,0 +1,48 @@
+import unittest
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+from assertpy import assert_that
+from dacite import MissingValueError
+
+from datamap.columns import to_columns
+from tests.unit.fixtures.tags import Tag
+
+
+@dataclass
+class Score:
+    id: int
+    score: Optional[float] = None
+
+
+class ColumnsTestCase(unittest.TestCase):
+    def test_to_columns(self):
+        records = [
+            {"id": 35792, "tag": "(LANGUAGE)", "filter": "usertag", "color_code": "rgb(83,146,255)", "is_visible": True},
+            {"id": 7956854, "tag": "2019", "filter": "usertag", "color_code": "rgb(250,163,56)"},
+        ]
+
+        actual = to_columns(Tag, records)
+
+        assert_that(actual["id"]).is_equal_to(array("q", [35792, 7956854]))
+        assert_that(actual["tag"]).is_equal_to(["(LANGUAGE)", "2019"])
+        assert_that(actual["is_visible"]).is_equal_to([True, False])
+        assert_that(actual["is_category_model_tag"]).is_equal_to([None, None])
+
+    def test_to_columns_when_value_is_missing(self):
+        with self.assertRaises(MissingValueError) as context:
+            to_columns(Tag, [{"id": 35792, "tag": "(LANGUAGE)", "color_code": "rgb(83,146,255)"}])
+
+        assert_that(context.exception.field_path).is_equal_to("filter")
+
+    def test_to_columns_stores_optional_numbers_in_arrays_unless_values_are_none(self):
+        actual = to_columns(Score, [{"id": 1, "score": 0.5}, {"id": 2, "score": 1.5}])
+
+        assert_that(actual["score"]).is_equal_to(array("d", [0.5, 1.5]))
+        assert_that(to_columns(Score, [{"id": 1, "score": 0.5}, {"id": 2}])["score"]).is_equal_to([0.5, None])
+
+    def test_to_columns_when_values_do_not_fit_in_array(self):
+        actual = to_columns(Score, [{"id": 1 << 64}, {"id": None}])
+
+        assert_that(actual["id"]).is_equal_to([1 << 64, None])
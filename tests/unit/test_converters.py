@@ -1,14 +1,31 @@
 import unittest
-from dataclasses import Field, fields
+from dataclasses import Field, fields, dataclass
+from decimal import Decimal
+from typing import Optional
+from datetime import datetime
 
 from assertpy import assert_that
+from dacite import WrongTypeError
 from mockito import mock
 
-from datamap.converters import identity, resolve_attribute_type_names, resolve_converter, converter_names
+from datamap.converters import identity, resolve_attribute_type_names, resolve_converter, converter_names, \
+    convert_attributes, converter_cache_info, converters, ConverterRegistry, default_registry
+from datamap.dicts import from_dicts
 from datamap.time import parse_timestamp
 from tests.unit.fixtures.date_attributes import DateAttribute
 
 
+class Identifier(str):
+    pass
+
+
+@dataclass
+class Measurement:
+    id: str
+    value: Decimal
+    measured_on: Optional[datetime] = None
+
+
 class ConvertersTestCase(unittest.TestCase):
     def test_resolve_attribute_types_when_string_type_as_String(self):
         attribute = mock({"type": "str"}, spec=Field)
@@ -86,3 +103,138 @@ class ConvertersTestCase(unittest.TestCase):
                                           "uuid",
                                           "any",
                                           "nonetype")
+
+    def test_convert_attributes(self):
+        data = {"id": "b0aa940d-61d9-4b83-94dc-1fd8f2b88dbb", "value": 1647648000, "asset": {"name": "Asset"}}
+
+        actual = convert_attributes(fields(DateAttribute), data)
+
+        assert_that(actual["value"]).is_equal_to(datetime.fromtimestamp(1647648000))
+        assert_that(actual["asset"]).is_same_as(data["asset"])
+        assert_that(data["value"]).is_equal_to(1647648000)
+
+    def test_convert_attributes_inplace(self):
+        data = {"id": "b0aa940d-61d9-4b83-94dc-1fd8f2b88dbb", "value": 1647648000}
+
+        actual = convert_attributes(fields(DateAttribute), data, inplace=True)
+
+        assert_that(actual).is_same_as(data)
+        assert_that(data["value"]).is_equal_to(datetime.fromtimestamp(1647648000))
+
+    def test_resolve_converter_is_cached_on_type_of_value(self):
+        field = fields(DateAttribute)[6]
+        resolve_converter(field, 1647648000000)
+        hits = converter_cache_info().hits
+
+        actual = resolve_converter(field, 1647648000001)
+
+        assert_that(actual).is_same_as(parse_timestamp)
+        assert_that(converter_cache_info().hits).is_equal_to(hits + 1)
+
+    def test_resolve_converter_when_value_is_unhashable(self):
+        field = fields(DateAttribute)[0]
+
+        actual = resolve_converter(field, ["b0aa940d-61d9-4b83-94dc-1fd8f2b88dbb"])
+
+        assert_that(actual).is_same_as(identity)
+
+    def test_resolve_converter_when_converter_registered_after_resolution(self):
+        field = fields(DateAttribute)[0]
+        assert_that(resolve_converter(field, 1)).is_same_as(identity)
+
+        converters["int_str"] = str
+        try:
+            actual = resolve_converter(field, 1)
+        finally:
+            del converters["int_str"]
+
+        assert_that(actual).is_same_as(str)
+        assert_that(resolve_converter(field, 1)).is_same_as(identity)
+
+    def test_converter_registry_resolves_on_source_and_target_type(self):
+        registry = ConverterRegistry()
+        registry.register(str, Decimal, Decimal)
+
+        actual = registry.resolve(fields(Measurement)[1], str)
+
+        assert_that(actual).is_same_as(Decimal)
+        assert_that(registry.resolve(fields(Measurement)[1], int)).is_same_as(identity)
+
+    def test_converter_registry_resolves_on_mro_of_source_type(self):
+        registry = ConverterRegistry()
+        registry.register(str, Decimal, Decimal)
+
+        actual = registry.resolve(fields(Measurement)[1], Identifier)
+
+        assert_that(actual).is_same_as(Decimal)
+
+    def test_converter_registry_distinguishes_types_with_same_name(self):
+        registry = ConverterRegistry()
+        registry.register(str, type("Decimal", (), {}), str.upper)
+
+        actual = registry.resolve(fields(Measurement)[1], str)
+
+        assert_that(actual).is_same_as(identity)
+
+    def test_converter_registry_resolves_optional_target_type(self):
+        registry = ConverterRegistry()
+        registry.register(int, datetime, parse_timestamp)
+
+        actual = registry.resolve(fields(Measurement)[2], int)
+
+        assert_that(actual).is_same_as(parse_timestamp)
+
+    def test_converter_registry_gives_precedence_to_own_converters_over_parent(self):
+        parent = ConverterRegistry()
+        parent.register(str, Decimal, float)
+        registry = ConverterRegistry(parent=parent)
+        registry.register(object, Decimal, Decimal)
+
+        actual = registry.resolve(fields(Measurement)[1], str)
+
+        assert_that(actual).is_same_as(Decimal)
+        assert_that(parent.resolve(fields(Measurement)[1], str)).is_same_as(float)
+
+    def test_converter_registry_falls_back_on_parent_and_named_converters(self):
+        registry = ConverterRegistry(parent=default_registry)
+
+        actual = registry.resolve(fields(DateAttribute)[6], int)
+
+        assert_that(actual).is_same_as(parse_timestamp)
+
+    def test_converter_registry_reindexes_when_registering_converter(self):
+        registry = ConverterRegistry()
+        field = fields(Measurement)[1]
+        assert_that(registry.resolve(field, str)).is_same_as(identity)
+
+        registry.register(str, Decimal, Decimal)
+
+        assert_that(registry.resolve(field, str)).is_same_as(Decimal)
+        assert_that(registry.cache_info().misses).is_equal_to(2)
+
+    def test_converter_cache_info_counts_lookups_of_mapped_records(self):
+        data = [{"id": str(index), "value": "12.5", "measuredOn": 1647648000} for index in range(100)]
+
+        for engine in ("dacite", "codegen"):
+            registry = ConverterRegistry(parent=default_registry)
+            registry.register(str, Decimal, Decimal)
+
+            from_dicts(data, data_class=Measurement, engine=engine, registry=registry)
+            for row in data:
+                from_dicts(dict(row), data_class=Measurement, engine=engine, registry=registry)
+
+            info = registry.cache_info()
+            assert_that(info.hits + info.misses).is_greater_than_or_equal_to(600)
+            assert_that(info.hits / (info.hits + info.misses)).is_greater_than(0.95)
+
+    def test_from_dicts_with_scoped_converter_registry(self):
+        registry = ConverterRegistry(parent=default_registry)
+        registry.register(str, Decimal, Decimal)
+        data = {"id": "1", "value": "12.5", "measuredOn": 1647648000}
+
+        actual = from_dicts(data, data_class=Measurement, registry=registry)
+
+        assert_that(actual.value).is_equal_to(Decimal("12.5"))
+        assert_that(actual.measured_on).is_equal_to(datetime.fromtimestamp(1647648000))
+        with self.assertRaises(WrongTypeError):
+            from_dicts(data, data_class=Measurement)
@@ -1,17 +1,38 @@
 import unittest
+from dataclasses import dataclass
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import List
 
 from assertpy import assert_that
+from dacite import MissingValueError
 
 import tests
-from datamap.dicts import flatten_dict, from_dicts, rename_keys, remove_keys, from_collection, from_iterable, from_dict
+import tests.unit.fixtures.relations
+import tests.unit.fixtures.tags
+from datamap.converters import ConverterRegistry, default_registry
+from datamap.dicts import flatten_dict, from_dicts, rename_keys, remove_keys, from_collection, from_iterable, from_dict, \
+    resolve_data_class
 from tests.unit.fixtures.date_attributes import DateAttribute
 from tests.unit.fixtures.mentions import Mentions
+from tests.unit.fixtures.relations import Asset, AssetType, Relation
+from tests.unit.fixtures.tags import Tag
 
 ASSET_NAME = "2022-03-17 #1"
 TYPE_NAME = "Effective End Date"
 
 
+@dataclass
+class Line:
+    amount: Decimal
+
+
+@dataclass
+class Order:
+    id: str
+    lines: List[Line]
+
+
 class DictTestCase(unittest.TestCase):
     def test_flatten_dict_when_value_contains_nested_dicts_then_flatten_those(
         self,
@@ -394,6 +415,23 @@ class DictTestCase(unittest.TestCase):
             }
         )
 
+    def test_rename_keys_does_not_modify_passed_dict_nor_copy_nested_values(self):
+        value = {"id": "cobblehillblog.com", "profile": {"name": "Charles Brown"}}
+
+        actual = rename_keys(value, ("id", "service_id"))
+
+        assert_that(actual).is_equal_to({"service_id": "cobblehillblog.com", "profile": {"name": "Charles Brown"}})
+        assert_that(actual["profile"]).is_same_as(value["profile"])
+        assert_that(value).contains_key("id")
+
+    def test_rename_keys_inplace(self):
+        value = {"id": "cobblehillblog.com", "managed": False}
+
+        actual = rename_keys(value, ("id", "service_id"), inplace=True)
+
+        assert_that(actual).is_same_as(value)
+        assert_that(value).is_equal_to({"service_id": "cobblehillblog.com", "managed": False})
+
     def test_rename_keys_when_illegal_argument(self):
         with self.assertRaises(AttributeError) as context:
             rename_keys(["value"], ("id", "service_id"), ("img", "image_url"), ("fullname", "full_name"))
@@ -525,3 +563,142 @@ class DictTestCase(unittest.TestCase):
             from_iterable({})
 
         assert_that(str(context.exception)).is_equal_to("Invalid argument type dict passed as data, expected an iterable which isn't a collection!")
+
+    def test_from_dicts_with_codegen_engine(self):
+        value = [{"id": 35792, "tag": "(LANGUAGE)", "filter": "usertag:\"(LANGUAGE)\"", "colorCode": "rgb(83,146,255)"}]
+
+        actual = from_dicts(value, data_class=Tag, engine="codegen")
+
+        assert_that(actual).is_equal_to(from_dicts(value, data_class=Tag))
+        assert_that(actual[0].color_code).is_equal_to("rgb(83,146,255)")
+
+    def test_from_dicts_with_columnar_output(self):
+        value = [
+            {"id": "1", "createdBy": "2", "createdOn": 1647520829437, "system": False,
+             "type": {"name": TYPE_NAME}, "asset": {"id": "3"}, "value": 1647648000000},
+            {"id": "4", "createdBy": "5", "createdOn": 1647520829437, "system": True,
+             "type": {"name": TYPE_NAME}, "asset": {"id": "6", "name": ASSET_NAME}, "value": 1647648000000},
+        ]
+
+        actual = from_dicts(value, data_class=DateAttribute, flatten=True, columnar=True)
+
+        assert_that(actual["id"]).is_equal_to(["1", "4"])
+        assert_that(actual["asset_name"]).is_equal_to([None, ASSET_NAME])
+        assert_that(actual["system"]).is_equal_to([False, True])
+        assert_that(actual["value"]).is_equal_to([datetime.fromtimestamp(1647648000)] * 2)
+
+    def test_from_collection_with_columnar_output_when_no_dataclass(self):
+        with self.assertRaises(AttributeError) as context:
+            from_collection([{}], module="tests.unit.fixtures.date_attributes", columnar=True)
+
+        assert_that(str(context.exception)).is_equal_to(
+            "Columnar output requires a data_class, it can't be resolved from a module!"
+        )
+
+    def test_resolve_data_class_from_module_is_cached(self):
+        actual = resolve_data_class({"resource_type": "DateAttribute"}, module="tests.unit.fixtures.date_attributes")
+
+        assert_that(actual).is_same_as(DateAttribute)
+        assert_that(
+            resolve_data_class({"resource_type": "DateAttribute"}, module="tests.unit.fixtures.date_attributes")
+        ).is_same_as(actual)
+
+    def test_resolve_data_class_when_not_found_in_module_then_warn_once(self):
+        with self.assertLogs(level="WARNING") as logs:
+            for _ in range(3):
+                actual = resolve_data_class({"type": "Unknown"}, data_class_type_key="type", module=tests.unit.fixtures.tags)
+
+        assert_that(actual).is_none()
+        assert_that(logs.output).is_length(1)
+
+    def test_from_dicts_with_discriminator_map(self):
+        value = [
+            {"kind": "tag", "id": 35792, "tag": "(LANGUAGE)", "filter": "usertag", "colorCode": "rgb(83,146,255)"},
+            {"kind": "mention", "id": "43769358878509009", "uniqueId": "46283_43769358878509009"},
+        ]
+
+        actual = from_dicts(value, data_class_type_key="kind", module={"tag": Tag, "mention": Mentions})
+
+        assert_that(actual[0]).is_type_of(Tag)
+        assert_that(actual[1]).is_type_of(Mentions)
+        assert_that(actual[1].unique_id).is_equal_to("46283_43769358878509009")
+
+    def test_from_dict_maps_nested_dicts_into_nested_data_classes(self):
+        data = {"id": "1", "source": {"id": "2", "displayName": "source", "type": {"id": "3", "name": "Table"}},
+                "targets": [{"id": "4", "type": {"id": "5", "name": "Column"}}]}
+
+        actual = from_dict(data, data_class=Relation)
+
+        assert_that(actual).is_equal_to(
+            Relation("1", Asset("2", AssetType("3", "Table"), "source"), [Asset("4", AssetType("5", "Column"))])
+        )
+
+    def test_from_dict_maps_nested_dicts_when_data_class_is_resolved_from_module(self):
+        data = {"type": "Relation", "id": "1", "source": {"id": "2", "type": {"id": "3", "name": "Table"}},
+                "targets": []}
+
+        actual = from_dict(data, data_class_type_key="type", module=tests.unit.fixtures.relations)
+
+        assert_that(actual).is_equal_to(Relation("1", Asset("2", AssetType("3", "Table")), []))
+
+    def test_from_dict_keeps_nested_subtrees_when_flattening_a_data_class_resolved_from_module(self):
+        data = {"type": "Relation", "id": "1", "source": {"id": "2", "type": {"id": "3", "name": "Table"}},
+                "targets": []}
+
+        actual = from_dict(data, data_class_type_key="type", module=tests.unit.fixtures.relations, flatten=True)
+
+        assert_that(actual).is_equal_to(from_dict(data, data_class=Relation, flatten=True))
+        assert_that(actual.source).is_equal_to(Asset("2", AssetType("3", "Table")))
+
+    def test_from_dicts_collects_errors_in_a_single_pass(self):
+        errors = []
+        data = [
+            {"id": 1, "tag": "tag 1", "filter": "", "colorCode": ""},
+            {"id": 2, "filter": "", "colorCode": ""},
+            {},
+            {"id": 3, "tag": "tag 3", "filter": "", "colorCode": ""},
+            {"id": 4, "tag": "tag 4", "filter": "", "colorCode": "", "isSmartTag": "no"},
+        ]
+
+        for engine in ("dacite", "codegen"):
+            errors.clear()
+            actual = from_dicts(data, data_class=Tag, engine=engine, errors=errors)
+
+            assert_that(actual).is_equal_to([
+                Tag(id=1, tag="tag 1", filter="", color_code=""),
+                {},
+                Tag(id=3, tag="tag 3", filter="", color_code=""),
+            ])
+            assert_that(errors).extracting("index", "field", "value").is_equal_to(
+                [(1, "tag", None), (4, "is_smart_tag", "no")]
+            )
+            assert_that(errors[0].exception).is_instance_of(MissingValueError)
+            assert_that(str(errors[1])).starts_with("Failed to map row 4: wrong value type")
+
+    def test_from_dicts_collecting_errors_when_invalid_options(self):
+        assert_that(from_dicts).raises(AttributeError).when_called_with(
+            {"id": 1}, data_class=Tag, errors=[]
+        ).is_equal_to("Invalid argument type dict passed as data, errors can only be collected for a collection!")
+        assert_that(from_dicts).raises(AttributeError).when_called_with(
+            [{"id": 1}], data_class=Tag, columnar=True, errors=[]
+        ).is_equal_to("Errors can't be collected for columnar output!")
+        assert_that(from_dicts).raises(AttributeError).when_called_with(
+            [{"resource_type": "Tag"}], module=tests.unit.fixtures.tags, errors=[]
+        ).is_equal_to("Collecting errors requires a data_class, it can't be resolved from a module!")
+
+    def test_from_dicts_collects_field_and_value_of_failing_converters(self):
+        registry = ConverterRegistry(parent=default_registry)
+        registry.register(str, Decimal, Decimal)
+        data = [{"id": "1", "lines": [{"amount": "1.5"}, {"amount": "abc"}]}, {"id": "2", "lines": []}]
+
+        for engine in ("dacite", "codegen"):
+            errors = []
+
+            actual = from_dicts(data, data_class=Order, engine=engine, registry=registry, errors=errors)
+
+            assert_that(actual).is_equal_to([Order("2", [])])
+            assert_that(errors).extracting("index", "field", "value").is_equal_to([(0, "lines[1].amount", "abc")])
+            assert_that(errors[0].exception).is_instance_of(InvalidOperation)
+            errors.clear()
+            from_dicts([{"amount": "x"}], data_class=Line, engine=engine, registry=registry, errors=errors)
+            assert_that(errors).extracting("field", "value").is_equal_to([("amount", "x")])
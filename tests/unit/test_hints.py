@@ -0,0 +1,52 @@
+import unittest
+from dataclasses import fields
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Union
+
+from assertpy import assert_that
+
+from datamap.converters import (ConverterRegistry, convert_attributes, default_registry, resolve_attribute_type_names,
+                                resolve_attribute_types)
+from datamap.dicts import from_dicts
+from datamap.hints import field_type, field_types, type_hints
+from tests.unit.fixtures.invoices import CreditNote, Invoice
+
+
+class HintsTestCase(unittest.TestCase):
+    def test_field_types_resolves_string_annotations_once_per_data_class(self):
+        actual = field_types(Invoice)
+
+        assert_that(actual).is_same_as(field_types(Invoice))
+        assert_that(type_hints(Invoice)).is_equal_to(
+            {"id": int, "amount": Union[Decimal, None], "lines": Optional[Dict[str, List[int]]],
+             "issued_on": Optional[datetime]}
+        )
+        assert_that(actual["lines"].types).is_equal_to((dict, type(None)))
+        assert_that(actual["issued_on"].type_names).is_equal_to(("datetime", "NoneType"))
+
+    def test_field_type_is_indexed_by_field(self):
+        attribute = fields(Invoice)[1]
+        field_types(Invoice)
+
+        assert_that(field_type(attribute).type).is_equal_to(Union[Decimal, None])
+        assert_that(resolve_attribute_types(attribute)).is_equal_to([Decimal, type(None)])
+        assert_that(resolve_attribute_type_names(attribute)).is_equal_to(["Decimal", "NoneType"])
+
+    def test_from_dicts_resolves_typed_converters_of_string_annotations(self):
+        registry = ConverterRegistry(parent=default_registry)
+        registry.register(str, Decimal, Decimal)
+
+        actual = from_dicts({"id": 1, "amount": "2.5", "lines": {"a": [1]}, "issuedOn": 1647520829}, data_class=Invoice,
+                            registry=registry, engine="codegen")
+
+        assert_that(actual).is_equal_to(Invoice(1, Decimal("2.5"), {"a": [1]}, datetime.fromtimestamp(1647520829)))
+
+    def test_converters_resolved_before_string_annotations_are_not_cached(self):
+        registry = ConverterRegistry(parent=default_registry)
+        registry.register(str, Decimal, Decimal)
+        convert_attributes(fields(CreditNote), {"id": 1, "amount": "1.5"}, registry=registry)
+
+        actual = from_dicts({"id": 1, "amount": "1.5"}, data_class=CreditNote, registry=registry)
+
+        assert_that(actual).is_equal_to(CreditNote(1, Decimal("1.5")))
@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+
+from assertpy import assert_that
+
+from datamap import instrumentation
+from datamap.dicts import from_dict, from_dicts
+from datamap.instrumentation import instrument
+from datamap.streams import from_stream
+from tests.unit.fixtures.date_attributes import DateAttribute
+from tests.unit.fixtures.tags import Tag
+
+TYPE_NAME = "Effective End Date"
+
+DATE_ATTRIBUTE = {
+    "id": "1",
+    "createdBy": "2",
+    "createdOn": 1647520829437,
+    "system": False,
+    "type": {"id": "3", "name": TYPE_NAME},
+    "asset": {"id": "4"},
+    "value": 1647648000000,
+}
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    def test_instrument_records_stages_per_data_class(self):
+        with instrument() as metrics:
+            from_dict(DATE_ATTRIBUTE, data_class=DateAttribute, flatten=True)
+            from_dicts([{"id": 1, "tag": "x", "filter": "f", "color_code": "red"}] * 3, data_class=Tag)
+
+        actual = metrics.to_dict()["data_classes"]
+
+        assert_that(actual).contains_only("DateAttribute", "Tag")
+        assert_that(actual["DateAttribute"]["stages"]).contains_only(*instrumentation.STAGES)
+        assert_that(actual["DateAttribute"]["stages"]["flatten"]).contains_entry({"calls": 1}, {"records": 1})
+        assert_that(actual["Tag"]["stages"]).does_not_contain_key("flatten")
+        assert_that(actual["Tag"]["stages"]["construct"]).contains_entry({"records": 3})
+        assert_that(actual["DateAttribute"]["converters"]).is_equal_to(
+            {"value.parse_timestamp": 1, "created_on.parse_timestamp": 1}
+        )
+        assert_that(actual["Tag"]["keys"]["hits"] + actual["Tag"]["keys"]["misses"]).is_equal_to(12)
+
+    def test_instrument_maps_like_uninstrumented_mapping(self):
+        with instrument():
+            actual = from_dict(DATE_ATTRIBUTE, data_class=DateAttribute, flatten=True, engine="codegen")
+
+        assert_that(actual).is_equal_to(from_dict(DATE_ATTRIBUTE, data_class=DateAttribute, flatten=True))
+
+    def test_instrument_exports_cache_hit_rates(self):
+        with instrument() as metrics:
+            from_dicts([{"id": 1, "tag": "x", "filter": "f", "color_code": "red"}] * 2, data_class=Tag)
+
+        actual = metrics.to_dict()["caches"]
+
+        assert_that(actual).contains_key("underscore", "camelize", "merge", "converters")
+        assert_that(actual["converters"]).contains_key("hits", "misses", "hit_rate")
+
+    def test_instrument_calls_observer_and_restores_previous_state(self):
+        observed = []
+
+        with instrument(lambda *event: observed.append(event)):
+            from_dicts([{"id": 1, "tag": "x", "filter": "f", "color_code": "red"}], data_class=Tag, columnar=True)
+
+        assert_that(instrumentation.current()).is_none()
+        assert_that([event[:2] for event in observed]).is_equal_to(
+            [("Tag", "keys"), ("Tag", "convert"), ("Tag", "construct")]
+        )
+
+    def test_instrument_counts_key_translations_actually_performed(self):
+        rows = [{"id": 1, "label": "x", "filter": "f", "colorCode": "red"}] * 1000
+
+        with instrument() as metrics:
+            from_dicts(rows, data_class=Tag, rename=[("label", "tag")])
+
+        assert_that(metrics.to_dict()["data_classes"]["Tag"]["keys"]).contains_entry({"hits": 3996}, {"misses": 4})
+
+    def test_instrument_exports_converter_lookups_of_mapped_records(self):
+        with instrument() as metrics:
+            from_dicts([DATE_ATTRIBUTE] * 10, data_class=DateAttribute, flatten=True)
+
+        assert_that(metrics.to_dict()["caches"]["converters"]["hit_rate"]).is_greater_than(0.9)
+
+    def test_instrument_is_scoped_to_concurrent_tasks_and_prefetching_threads(self):
+        async def map_tags(count):
+            with instrument() as metrics:
+                for _ in range(count):
+                    from_dict({"id": 1, "tag": "x", "filter": "f", "color_code": "red"}, data_class=Tag)
+                    await asyncio.sleep(0)
+            return metrics.to_dict()["data_classes"]["Tag"]["stages"]["construct"]["records"]
+
+        async def map_concurrently():
+            return await asyncio.gather(map_tags(3), map_tags(5))
+
+        assert_that(asyncio.run(map_concurrently())).is_equal_to([3, 5])
+        with instrument() as metrics:
+            list(from_stream([{"id": 1, "tag": "x", "filter": "f", "color_code": "red"}] * 4, data_class=Tag,
+                             chunk_size=2, prefetch=1))
+        assert_that(metrics.to_dict()["data_classes"]["Tag"]["stages"]["construct"]["records"]).is_equal_to(4)
@@ -0,0 +1,79 @@
+import json
+import mmap
+import os
+import tempfile
+import unittest
+from io import BytesIO
+from itertools import chain
+from types import GeneratorType
+
+from assertpy import assert_that
+
+from datamap.io import from_json, iter_json_array, iter_ndjson
+from tests.unit.fixtures.tags import Tag
+
+RECORDS = [
+    {"id": 1, "tag": "Ünïcödé", "filter": "usertag:\"1\"", "colorCode": "rgb(83,146,255)", "parent": {"id": 0}},
+    {"id": 2, "tag": "[array, like]", "filter": "usertag:\"2\"", "colorCode": "red", "isVisible": True},
+]
+
+
+class IoTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "tags.json")
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(RECORDS, file, indent=2, ensure_ascii=False)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_iter_json_array_when_values_span_multiple_buffers(self):
+        actual = list(iter_json_array(self.path, buffer_size=7))
+
+        assert_that(actual).is_equal_to(RECORDS)
+
+    def test_iter_json_array_when_array_is_empty_or_unterminated(self):
+        assert_that(list(iter_json_array(BytesIO(b" [ ] ")))).is_empty()
+        assert_that(list).raises(json.JSONDecodeError).when_called_with(iter_json_array(BytesIO(b'[{"id": 1},')))
+        assert_that(list).raises(json.JSONDecodeError).when_called_with(iter_json_array(BytesIO(b'{"id": 1}')))
+
+    def test_iter_json_array_when_array_is_malformed(self):
+        for data in (b'[{"a": 1} {"a": 2}]', b"[1,,,2]", b"[1, 2,]", b"[,1]", b"[1, 2] trailing", b"[] []"):
+            for buffer_size in (1, 1024):
+                assert_that(list).raises(json.JSONDecodeError).when_called_with(
+                    iter_json_array(BytesIO(data), buffer_size=buffer_size)
+                )
+        assert_that(list(iter_json_array(BytesIO(b" [ 1 ,\n 2 ] \n"), buffer_size=1))).is_equal_to([1, 2])
+
+    def test_iter_ndjson_skips_blank_lines(self):
+        data = b"\n".join(json.dumps(record).encode() for record in RECORDS) + b"\n\n"
+
+        actual = list(iter_ndjson(BytesIO(data)))
+
+        assert_that(actual).is_equal_to(RECORDS)
+
+    def test_from_json_maps_json_array_file_lazily(self):
+        actual = from_json(self.path, data_class=Tag, chunk_size=1, buffer_size=16)
+
+        assert_that(actual).is_instance_of(chain)
+        assert_that(list(actual)).is_equal_to([
+            Tag(id=1, tag="Ünïcödé", filter="usertag:\"1\"", color_code="rgb(83,146,255)"),
+            Tag(id=2, tag="[array, like]", filter="usertag:\"2\"", color_code="red", is_visible=True),
+        ])
+
+    def test_from_json_maps_memory_mapped_ndjson_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"\n".join(json.dumps(record).encode() for record in RECORDS))
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            actual = list(from_json(data, data_class=Tag, lines=True))
+
+        assert_that(actual).extracting("id").is_equal_to([1, 2])
+
+    def test_from_json_when_invalid_source(self):
+        assert_that(from_json).raises(AttributeError).when_called_with(RECORDS).is_equal_to(
+            "Invalid argument type list passed as source, expected a path or a binary stream!"
+        )
+
+    def test_iter_ndjson_is_lazy(self):
+        assert_that(iter_ndjson(self.path)).is_instance_of(GeneratorType)
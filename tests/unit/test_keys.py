@@ -0,0 +1,124 @@
+import unittest
+from dataclasses import dataclass
+
+from assertpy import assert_that
+
+from datamap.keys import (
+    camelize,
+    compile_key_table,
+    key_cache_info,
+    pep8_compliant_keys,
+    seed_key_cache,
+    underscore,
+    DefaultKeyMergerStrategy,
+    flatten_dict,
+)
+
+
+@dataclass
+class Document:
+    document_id: str
+    last_modified_by: str
+
+
+class KeysTestCase(unittest.TestCase):
+    def test_pep8_compliant_keys_uses_key_cache(self):
+        pep8_compliant_keys({"isSmartTag": False})
+        hits = key_cache_info()["underscore"].hits
+
+        actual = pep8_compliant_keys({"isSmartTag": False})
+
+        assert_that(actual).is_equal_to({"is_smart_tag": False})
+        assert_that(key_cache_info()["underscore"].hits).is_equal_to(hits + 1)
+
+    def test_default_key_merger_strategy_uses_key_cache(self):
+        DefaultKeyMergerStrategy().apply("asset", "resourceType")
+        hits = key_cache_info()["merge"].hits
+
+        actual = DefaultKeyMergerStrategy().apply("asset", "resourceType")
+
+        assert_that(actual).is_equal_to("assetResourceType")
+        assert_that(key_cache_info()["merge"].hits).is_equal_to(hits + 1)
+
+    def test_seed_key_cache_with_field_names_of_dataclass(self):
+        seed_key_cache(Document)
+        misses = key_cache_info()["underscore"].misses
+
+        actual = pep8_compliant_keys({"documentId": "1", "lastModifiedBy": "2", "document_id": "3"})
+
+        assert_that(actual).is_equal_to({"document_id": "3", "last_modified_by": "2"})
+        assert_that(key_cache_info()["underscore"].misses).is_equal_to(misses)
+
+    def test_key_cache_is_bounded(self):
+        assert_that(underscore.cache_info().maxsize).is_positive()
+        assert_that(camelize.cache_info().maxsize).is_positive()
+
+    def test_flatten_dict_keeps_order_of_nested_keys(self):
+        actual = flatten_dict({"a": 1, "b": {"c": {"d": 2}, "e": 3}, "f": 4})
+
+        assert_that(list(actual.items())).is_equal_to([("a", 1), ("bCD", 2), ("bE", 3), ("f", 4)])
+
+    def test_flatten_dict_is_not_limited_by_recursion_depth(self):
+        value = leaf = {}
+        for _ in range(5000):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        leaf["id"] = 1
+
+        actual = flatten_dict(value)
+
+        assert_that(actual).is_length(1)
+        assert_that(list(actual.values())).is_equal_to([1])
+
+    def test_flatten_dict_with_max_depth(self):
+        actual = flatten_dict({"id": 1, "source": {"id": 2, "profile": {"name": "Charles"}}}, max_depth=1)
+
+        assert_that(actual).is_equal_to({"id": 1, "sourceId": 2, "sourceProfile": {"name": "Charles"}})
+
+    def test_flatten_dict_with_include_paths(self):
+        value = {
+            "id": 1,
+            "type": {"name": "Effective End Date"},
+            "asset": {"id": 2},
+            "source": {"id": 3, "profile": {"name": "Charles"}, "owner": {"id": 4}},
+        }
+
+        actual = flatten_dict(value, include_paths=["type", "source.profile"])
+
+        assert_that(actual).is_equal_to(
+            {
+                "id": 1,
+                "typeName": "Effective End Date",
+                "asset": {"id": 2},
+                "sourceId": 3,
+                "sourceProfileName": "Charles",
+                "sourceOwner": {"id": 4},
+            }
+        )
+
+    def test_key_table_renames_and_removes_keys_in_a_single_pass(self):
+        table = compile_key_table([("img", "image_url"), ("id", "service_id")], ["managed"])
+
+        actual = table({"id": "blog", "img": None, "managed": False, "name": "Charles"})
+
+        assert_that(actual).is_equal_to({"service_id": "blog", "image_url": None, "name": "Charles"})
+        assert_that(table.keys).is_equal_to(
+            {"img": "image_url", "id": "service_id", "managed": None, "image_url": None, "service_id": None}
+        )
+
+    def test_key_table_when_renames_are_chained_or_swapped(self):
+        chained = compile_key_table([("a", "b"), ("b", "c")])
+        swapped = compile_key_table([("a", "tmp"), ("b", "a"), ("tmp", "b")])
+
+        assert_that(chained({"a": 1, "b": 2})).is_equal_to({"c": 1})
+        assert_that(swapped({"a": 1, "b": 2, "tmp": 3})).is_equal_to({"a": 2, "b": 1})
+
+    def test_key_table_sets_renamed_keys_to_none_when_missing(self):
+        actual = compile_key_table([("a", "b"), ("a", "c")], ["d"])({"x": 1, "d": 2})
+
+        assert_that(actual).is_equal_to({"x": 1, "b": None, "c": None})
+
+    def test_key_table_is_compiled_once_per_mappings(self):
+        actual = compile_key_table([["a", "b"]], ["c"])
+
+        assert_that(actual).is_same_as(compile_key_table((("a", "b"),), ("c",)))
@@ -0,0 +1,323 @@
+import unittest
+from dataclasses import dataclass, fields
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional, Union
+
+from assertpy import assert_that
+from dacite import MissingValueError, UnionMatchError, WrongTypeError
+
+from datamap.converters import converters, ConverterRegistry
+from datamap.mappers import compile_mapper, Mapper
+from datamap.records import record_type
+from tests.unit.fixtures.date_attributes import DateAttribute
+from tests.unit.fixtures.mentions import Mentions
+from tests.unit.fixtures.tags import Tag
+
+ASSET_NAME = "2022-03-17 #1"
+
+
+@dataclass
+class Price:
+    amount: Decimal
+    currency: Optional[str] = None
+
+
+@dataclass
+class Asset:
+    id: str
+    display_name: Optional[str] = None
+
+
+@dataclass
+class Relation:
+    id: str
+    source: Asset
+    targets: List[Asset]
+    price: Optional[Price] = None
+
+
+@dataclass
+class Reading:
+    value: Union[int, str]
+    unit: Optional[str] = None
+
+
+class BatchDecimalConverter:
+    def __init__(self):
+        self.batches: List[List[str]] = []
+
+    def __call__(self, value: str) -> Decimal:
+        return Decimal(value)
+
+    def convert_many(self, values: List[str]) -> List[Decimal]:
+        self.batches.append(values)
+        return list(map(Decimal, values))
+
+
+TYPE_NAME = "Effective End Date"
+
+
+class MapperTestCase(unittest.TestCase):
+    def test_compile_mapper_returns_same_plan_for_same_options(self):
+        actual = compile_mapper(Tag, rename=[("visible", "is_visible")], remove=["parent_id"])
+
+        assert_that(actual).is_instance_of(Mapper)
+        assert_that(actual).is_same_as(
+            compile_mapper(Tag, rename=[("visible", "is_visible")], remove=["parent_id"])
+        )
+        assert_that(actual).is_not_same_as(compile_mapper(Tag))
+
+    def test_compiled_mapper_when_flatten(self):
+        mapper = compile_mapper(DateAttribute, flatten=True)
+
+        actual = mapper(
+            {
+                "id": "b0aa940d-61d9-4b83-94dc-1fd8f2b88dbb",
+                "createdBy": "00000000-0000-0000-0000-000000900002",
+                "createdOn": 1647520829437,
+                "system": False,
+                "type": {"name": TYPE_NAME},
+                "asset": {"id": "794d2c0b-efd2-446d-9c18-0be336fd61d9", "name": ASSET_NAME},
+                "value": 1647648000000,
+            }
+        )
+
+        assert_that(actual).is_type_of(DateAttribute)
+        assert_that(actual.asset_id).is_equal_to("794d2c0b-efd2-446d-9c18-0be336fd61d9")
+        assert_that(actual.asset_name).is_equal_to(ASSET_NAME)
+        assert_that(actual.type_name).is_equal_to(TYPE_NAME)
+        assert_that(actual.value).is_equal_to(datetime.fromtimestamp(1647648000))
+        assert_that(actual.created_on).is_equal_to(datetime.fromtimestamp(1647520829.437))
+
+    def test_compiled_mapper_with_rename_and_remove(self):
+        mapper = compile_mapper(
+            Tag,
+            rename=[("is_smarttag", "is_smart_tag"), ("visible", "is_visible")],
+            remove=["category_model_tag"],
+        )
+        data = {
+            "tag": "(LANGUAGE)",
+            "id": 35792,
+            "isSmarttag": False,
+            "colorCode": "rgb(83,146,255)",
+            "filter": "usertag:\"(LANGUAGE)\"",
+            "visible": True,
+            "categoryModelTag": False,
+        }
+
+        actual = mapper(data)
+
+        assert_that(actual).is_equal_to(
+            Tag(
+                id=35792,
+                tag="(LANGUAGE)",
+                filter="usertag:\"(LANGUAGE)\"",
+                color_code="rgb(83,146,255)",
+                is_smart_tag=False,
+                is_visible=True,
+            )
+        )
+        assert_that(data).contains_key("isSmarttag", "categoryModelTag")
+
+    def test_compiled_mapper_when_no_data(self):
+        assert_that(compile_mapper(Tag)(None)).is_none()
+
+    def test_compiled_mapper_when_illegal_argument(self):
+        with self.assertRaises(AttributeError) as context:
+            compile_mapper(Tag)(["value"])
+
+        assert_that(str(context.exception)).is_equal_to(
+            "Invalid argument type list passed as data, expected a dict!"
+        )
+
+    def test_compiled_mapper_with_codegen_engine_maps_like_dacite_engine(self):
+        data = {
+            "id": "b0aa940d-61d9-4b83-94dc-1fd8f2b88dbb",
+            "createdBy": "00000000-0000-0000-0000-000000900002",
+            "system": False,
+            "type": {"name": TYPE_NAME},
+            "asset": {"id": "794d2c0b-efd2-446d-9c18-0be336fd61d9"},
+            "value": 1647648000000,
+        }
+        mapper = compile_mapper(DateAttribute, flatten=True, engine="codegen")
+
+        actual = mapper(data)
+
+        assert_that(mapper.engine).is_equal_to("codegen")
+        assert_that(actual).is_equal_to(compile_mapper(DateAttribute, flatten=True)(data))
+        assert_that(actual.asset_name).is_none()
+
+    def test_compiled_mapper_with_codegen_engine_when_value_is_missing(self):
+        mapper = compile_mapper(Tag, engine="codegen")
+
+        with self.assertRaises(MissingValueError) as context:
+            mapper({"id": 35792, "tag": "(LANGUAGE)", "colorCode": "rgb(83,146,255)"})
+
+        assert_that(context.exception.field_path).is_equal_to("filter")
+
+    def test_compiled_mapper_with_codegen_engine_when_value_has_wrong_type(self):
+        mapper = compile_mapper(Mentions, engine="codegen")
+
+        with self.assertRaises(WrongTypeError) as context:
+            mapper({"uniqueId": 46283, "id": "43769358878509009"})
+
+        assert_that(context.exception.field_path).is_equal_to("unique_id")
+        assert_that(context.exception.value).is_equal_to(46283)
+
+    def test_compiled_mapper_when_invalid_engine(self):
+        with self.assertRaises(AttributeError) as context:
+            compile_mapper(Tag, engine="reflection")
+
+        assert_that(str(context.exception)).is_equal_to(
+            "Invalid engine reflection passed, expected one of dacite, codegen!"
+        )
+
+    def test_compiled_mapper_when_converter_registered_after_first_mapping(self):
+        mapper = compile_mapper(Tag, engine="codegen")
+        data = {"id": 35792, "tag": "(LANGUAGE)", "filter": "", "colorCode": "", "isVisible": "yes"}
+        with self.assertRaises(WrongTypeError):
+            mapper(data)
+
+        converters["str_bool"] = lambda value: value == "yes"
+        try:
+            actual = mapper(data)
+        finally:
+            del converters["str_bool"]
+
+        assert_that(actual.is_visible).is_true()
+
+    def test_map_many_converts_columns_with_batch_converters(self):
+        converter = BatchDecimalConverter()
+        registry = ConverterRegistry()
+        registry.register(str, Decimal, converter)
+        mapper = compile_mapper(Price, registry=registry)
+
+        actual = mapper.map_many([{"amount": "1.5"}, None, {"amount": "2", "currency": "EUR"}])
+
+        assert_that(actual).is_equal_to([Price(Decimal("1.5")), None, Price(Decimal("2"), "EUR")])
+        assert_that(converter.batches).is_equal_to([["1.5", "2"]])
+
+    def test_map_many_with_codegen_engine_maps_like_dacite_engine(self):
+        data = [
+            {"id": "1", "createdBy": "2", "system": False, "type": {"name": TYPE_NAME},
+             "asset": {"id": "3"}, "value": 1647648000000, "createdOn": 1647520829},
+            {"id": "4", "createdBy": "5", "system": True, "type": {"name": TYPE_NAME},
+             "asset": {"id": "6", "name": ASSET_NAME}, "value": 1647648000},
+        ]
+
+        actual = compile_mapper(DateAttribute, flatten=True, engine="codegen").map_many(data)
+
+        assert_that(actual).is_equal_to(list(map(compile_mapper(DateAttribute, flatten=True), data)))
+        assert_that(actual[0].created_on).is_equal_to(datetime.fromtimestamp(1647520829))
+
+    def test_normalize_skips_subtrees_and_keys_not_used_by_data_class(self):
+        data = {"id": "1", "createdBy": "2", "system": False, "type": {"name": TYPE_NAME},
+                "asset": {"id": "3", "domain": {"id": "4"}}, "value": 1647648000,
+                "attributes": {"nested": {"deeply": True}}, "unknownKey": "ignored"}
+        mapper = Mapper(DateAttribute, flatten=True)
+
+        actual = mapper.normalize(data)
+
+        assert_that(actual).does_not_contain_key("unknown_key", "asset_domain_id", "attributes")
+        assert_that(actual).contains_entry({"asset_id": "3"}, {"type_name": TYPE_NAME})
+        assert_that(mapper._subtrees).contains_entry({"attributes": False}, {"asset": True})
+        assert_that(mapper._subtrees).does_not_contain_key("attributesNested")
+        assert_that(mapper(data)).is_equal_to(compile_mapper(DateAttribute, flatten=True)(data))
+
+    def test_normalize_keeps_rename_sources_of_data_class_fields(self):
+        mapper = Mapper(Tag, rename=[("visible", "is_visible")])
+
+        actual = mapper.normalize({"id": "1", "visible": True, "other": 1})
+
+        assert_that(actual).is_equal_to({"id": "1", "is_visible": True})
+
+    def test_mapper_maps_nested_dicts_into_nested_data_classes(self):
+        data = {"id": "1", "source": {"id": "2", "displayName": "source"},
+                "targets": [{"id": "3"}, {"id": "4", "displayName": "target"}],
+                "price": {"amount": Decimal("1.5")}}
+
+        actual = compile_mapper(Relation)(data)
+
+        assert_that(actual).is_equal_to(
+            Relation("1", Asset("2", "source"), [Asset("3"), Asset("4", "target")],
+                     Price(Decimal("1.5")))
+        )
+
+    def test_mapper_with_codegen_engine_maps_nested_dicts_like_dacite_engine(self):
+        data = [{"id": "1", "source": {"id": "2"}, "targets": []},
+                {"id": "3", "source": {"id": "4", "display_name": "x"}, "targets": [{"id": "5"}]}]
+        mapper = compile_mapper(Relation, engine="codegen")
+
+        actual = mapper.map_many(data)
+
+        assert_that(mapper.engine).is_equal_to("codegen")
+        assert_that(actual).is_equal_to([compile_mapper(Relation)(row) for row in data])
+
+    def test_mapper_shares_compiled_plan_of_nested_data_class(self):
+        compile_mapper(Relation)({"id": "1", "source": {"id": "2"}, "targets": []})
+
+        actual = compile_mapper(Relation)._converters["source"][dict].mapper
+
+        assert_that(actual).is_same_as(compile_mapper(Asset))
+
+    def test_mapper_applies_converters_on_nested_data_classes(self):
+        registry = ConverterRegistry()
+        registry.register(str, Decimal, Decimal)
+
+        actual = compile_mapper(Relation, registry=registry)(
+            {"id": "1", "source": {"id": "2"}, "targets": [], "price": {"amount": "2.5"}}
+        )
+
+        assert_that(actual.price).is_equal_to(Price(Decimal("2.5")))
+
+    def test_mapper_when_flatten_then_nested_data_class_fields_are_not_flattened(self):
+        actual = compile_mapper(Relation, flatten=True)(
+            {"id": "1", "source": {"id": "2"}, "targets": [{"id": "3"}]}
+        )
+
+        assert_that(actual).is_equal_to(Relation("1", Asset("2"), [Asset("3")]))
+
+    def test_mapper_when_nested_value_has_wrong_type(self):
+        assert_that(compile_mapper(Relation)).raises(WrongTypeError).when_called_with(
+            {"id": "1", "source": "2", "targets": []}
+        )
+
+    def test_codegen_engine_raises_same_type_errors_as_dacite_engine(self):
+        for data, error in (({"value": 1.5}, UnionMatchError), ({"value": 1, "unit": 2}, WrongTypeError)):
+            with self.assertRaises(error) as expected:
+                compile_mapper(Reading)(data)
+            with self.assertRaises(error) as actual:
+                compile_mapper(Reading, engine="codegen")(data)
+
+            assert_that(type(actual.exception)).is_same_as(type(expected.exception))
+            assert_that(str(actual.exception)).is_equal_to(str(expected.exception))
+
+    def test_mapper_reports_path_of_failing_field_in_nested_data_class(self):
+        for engine in ("dacite", "codegen"):
+            mapper = compile_mapper(Relation, engine=engine)
+
+            with self.assertRaises(WrongTypeError) as context:
+                mapper({"id": "1", "source": {"id": 2}, "targets": []})
+            assert_that(context.exception.field_path).is_equal_to("source.id")
+            with self.assertRaises(MissingValueError) as context:
+                mapper.map_many([{"id": "1", "source": {"id": "2"}, "targets": [{"id": "3"}, {}]}])
+            assert_that(context.exception.field_path).is_equal_to("targets[1].id")
+            with self.assertRaises(MissingValueError) as context:
+                mapper({"id": "1", "source": {"id": "2"}, "targets": [], "price": {"currency": "EUR"}})
+            assert_that(context.exception.field_path).is_equal_to("price.amount")
+
+    def test_compiled_mapper_populates_record_types_like_data_class(self):
+        data = {"id": "1", "createdBy": "2", "system": False, "type": {"name": TYPE_NAME},
+                "asset": {"id": "3"}, "value": 1647648000000, "createdOn": 1647520829}
+        expected = compile_mapper(DateAttribute, flatten=True)(data)
+
+        for engine in ("dacite", "codegen"):
+            for record in ("slots", "frozen", "tuple"):
+                actual = compile_mapper(DateAttribute, flatten=True, engine=engine, record=record)(dict(data))
+
+                assert_that(actual).is_instance_of(record_type(DateAttribute, record))
+                assert_that(hasattr(actual, "__dict__")).is_false()
+                assert_that([getattr(actual, attribute.name) for attribute in fields(DateAttribute)]).is_equal_to(
+                    [getattr(expected, attribute.name) for attribute in fields(DateAttribute)]
+                )
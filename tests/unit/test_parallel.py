@@ -0,0 +1,136 @@
+import unittest
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from unittest.mock import patch
+
+from assertpy import assert_that
+
+from datamap.converters import ConverterRegistry, converters, default_registry
+from datamap.dicts import from_dicts
+from datamap.errors import MappingError
+from datamap.mappers import compile_mapper
+from datamap.parallel import map_parallel
+from datamap.validation import Validation
+from tests.unit.fixtures.tags import Tag
+
+TAGS = [
+    {"id": index, "tag": f"tag {index}", "filter": f"usertag:\"{index}\"", "colorCode": "rgb(83,146,255)"}
+    for index in range(10)
+]
+
+
+def round_half_up(value: float) -> int:
+    return int(value + 0.5)
+
+
+class ParallelTestCase(unittest.TestCase):
+    def test_map_parallel_preserves_order(self):
+        actual = map_parallel(TAGS, Tag, workers=2, chunk_size=3, threshold=0)
+
+        assert_that(actual).is_equal_to(compile_mapper(Tag).map_many(TAGS))
+
+    def test_map_parallel_with_slotted_and_tuple_records(self):
+        for record in ("frozen", "tuple"):
+            actual = map_parallel(TAGS, Tag, record=record, workers=2, chunk_size=3, threshold=0)
+
+            assert_that(actual).is_equal_to(compile_mapper(Tag, record=record).map_many(TAGS))
+
+    def test_map_parallel_with_columnar_output(self):
+        actual = map_parallel(TAGS, Tag, columnar=True, workers=2, chunk_size=3, threshold=0)
+
+        assert_that(actual["id"]).is_equal_to(array("q", range(10)))
+        assert_that(actual["tag"]).is_equal_to([f"tag {index}" for index in range(10)])
+
+    def test_map_parallel_reports_index_of_failing_row(self):
+        data = TAGS[:7] + [{"id": 7.5, "tag": "tag 7", "filter": "", "colorCode": ""}] + TAGS[8:]
+
+        with self.assertRaises(MappingError) as context:
+            map_parallel(data, Tag, workers=2, chunk_size=3, threshold=0)
+
+        assert_that(context.exception.index).is_equal_to(7)
+        assert_that(context.exception.field).is_equal_to("id")
+
+    def test_map_parallel_below_threshold_maps_serially(self):
+        with self.assertRaises(MappingError) as context:
+            map_parallel([TAGS[0], {"id": 1}], Tag, workers=2)
+
+        assert_that(context.exception.index).is_equal_to(1)
+        assert_that(str(context.exception)).is_equal_to(
+            "Failed to map row 1: missing value for field \"tag\""
+        )
+
+    def test_from_dicts_with_workers(self):
+        actual = from_dicts(TAGS, data_class=Tag, workers=2)
+
+        assert_that(actual).is_length(10)
+        assert_that(actual[9]).is_equal_to(Tag(id=9, tag="tag 9", filter="usertag:\"9\"", color_code="rgb(83,146,255)"))
+
+    def test_map_parallel_collects_errors_of_failing_rows(self):
+        data = TAGS[:4] + [{"id": 4.5, "tag": "tag 4"}] + TAGS[5:8] + [{"id": 8}] + TAGS[9:]
+        errors = []
+
+        actual = map_parallel(data, Tag, workers=2, chunk_size=3, threshold=0, errors=errors)
+
+        assert_that(actual).extracting("id").is_equal_to([0, 1, 2, 3, 5, 6, 7, 9])
+        assert_that(errors).extracting("index").is_equal_to([4, 8])
+        assert_that(errors[0].field).is_equal_to("id")
+        assert_that(errors[0].value).is_equal_to(4.5)
+        assert_that(errors[1].field).is_equal_to("tag")
+
+    def test_from_dicts_with_workers_collects_errors(self):
+        errors = []
+
+        actual = from_dicts(TAGS + [{"id": 10}], data_class=Tag, workers=2, errors=errors)
+
+        assert_that(actual).is_length(10)
+        assert_that(errors).extracting("index").is_equal_to([10])
+
+    def test_map_parallel_reports_sampled_mismatches_to_callback_of_parent(self):
+        mismatches = []
+        validation = Validation("sampled", every=1, callback=lambda instance, error: mismatches.append(
+            (instance.tag, error.field_path, error.value)))
+        data = [{**tag, "id": tag["id"] + 0.5} for tag in TAGS]
+
+        actual = map_parallel(data, Tag, validation=validation, workers=2, chunk_size=3, threshold=0)
+
+        assert_that(actual).is_length(10)
+        assert_that(mismatches).is_equal_to([(f"tag {index}", "id", index + 0.5) for index in range(10)])
+
+    def test_map_parallel_maps_failing_chunk_once(self):
+        mismatches = []
+        validation = Validation("sampled", every=1, callback=lambda instance, error: mismatches.append(instance.tag))
+        data = [{**TAGS[0], "id": 0.5}, {"id": 1}]
+
+        for workers, threshold in ((1, 0), (2, 0)):
+            mismatches.clear()
+            with self.assertRaises(MappingError) as context:
+                map_parallel(data, Tag, validation=validation, workers=workers, chunk_size=2, threshold=threshold)
+
+            assert_that(context.exception.index).is_equal_to(1)
+            assert_that(mismatches).is_equal_to(["tag 0"])
+
+    def test_map_parallel_ships_converters_registered_at_runtime_to_spawned_workers(self):
+        converters["float_int"] = round_half_up
+        try:
+            spawn_executor = partial(ProcessPoolExecutor, mp_context=get_context("spawn"))
+            with patch("datamap.parallel.ProcessPoolExecutor", spawn_executor):
+                actual = map_parallel([{**tag, "id": tag["id"] + 0.5} for tag in TAGS], Tag, workers=2, chunk_size=5,
+                                      threshold=0)
+        finally:
+            del converters["float_int"]
+
+        assert_that(actual).extracting("id").is_equal_to(list(range(1, 11)))
+
+    def test_map_parallel_reports_field_and_value_of_failing_converter(self):
+        registry = ConverterRegistry(parent=default_registry)
+        registry.register(str, int, int)
+
+        with self.assertRaises(MappingError) as context:
+            map_parallel(TAGS[:3] + [{**TAGS[3], "id": "x"}], Tag, registry=registry, workers=2, chunk_size=2,
+                         threshold=0)
+
+        assert_that(context.exception.index).is_equal_to(3)
+        assert_that(context.exception.field).is_equal_to("id")
+        assert_that(context.exception.value).is_equal_to("x")
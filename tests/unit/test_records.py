@@ -0,0 +1,156 @@
+import pickle
+import sys
+import unittest
+from dataclasses import FrozenInstanceError, dataclass, field, fields, is_dataclass
+from datetime import datetime
+from typing import List
+
+from assertpy import assert_that
+
+from datamap.mappers import compile_mapper
+from datamap.records import record_type
+from tests.unit.fixtures.date_attributes import DateAttribute
+from tests.unit.fixtures.tags import Tag
+
+
+@dataclass
+class Report:
+    id: str
+    tags: List[str] = field(default_factory=list)
+    created_on: datetime = field(default=datetime(2022, 3, 17), compare=False)
+
+    @property
+    def size(self) -> int:
+        return len(self.tags)
+
+
+@dataclass
+class Labelled:
+    id: int
+
+    def label(self) -> str:
+        return f"#{self.id}"
+
+    @property
+    def double(self) -> int:
+        return self.id * 2
+
+
+@dataclass
+class Named(Labelled):
+    name: str = ""
+
+
+@dataclass
+class Shouted(Named):
+    def __post_init__(self):
+        self.name = self.name.upper()
+
+
+@dataclass
+class Checked:
+    id: int
+
+    def __post_init__(self):
+        if self.id < 0:
+            raise ValueError("negative id")
+
+
+@dataclass
+class CheckedName(Checked):
+    name: str = ""
+
+    def __post_init__(self):
+        super().__post_init__()
+        if not self.name:
+            raise ValueError("empty name")
+
+
+def size_of(instance) -> int:
+    return sys.getsizeof(instance) + (sys.getsizeof(vars(instance)) if hasattr(instance, "__dict__") else 0)
+
+
+class RecordsTestCase(unittest.TestCase):
+    def test_record_type_generates_slotted_variant_of_data_class(self):
+        slotted = record_type(Report, "slots")
+
+        actual = slotted("1", ["a"])
+
+        assert_that(is_dataclass(actual)).is_true()
+        assert_that(hasattr(actual, "__dict__")).is_false()
+        assert_that(actual.size).is_equal_to(1)
+        assert_that(repr(actual)).starts_with("Report(id='1', tags=['a']")
+        assert_that([attribute.name for attribute in fields(slotted)]).is_equal_to(["id", "tags", "created_on"])
+        assert_that(slotted("1").tags).is_not_same_as(slotted("1").tags)
+        assert_that(size_of(actual)).is_less_than(size_of(Report("1", ["a"])) * 0.6)
+
+    def test_record_type_generates_frozen_slotted_variant_of_data_class(self):
+        actual = record_type(Tag, "frozen")(id=1, tag="x", filter="f", color_code="red")
+
+        with self.assertRaises(FrozenInstanceError):
+            actual.id = 2
+        assert_that(hash(actual)).is_instance_of(int)
+
+    def test_record_type_generates_tuple_record_with_same_field_names(self):
+        actual = record_type(Tag, "tuple")(id=1, tag="x", filter="f", color_code="red")
+
+        assert_that(actual).is_instance_of(tuple)
+        assert_that(actual._fields).is_equal_to(tuple(attribute.name for attribute in fields(Tag)))
+        assert_that(actual.is_visible).is_false()
+
+    def test_record_type_keeps_methods_and_properties_of_base_classes(self):
+        for record in ("slots", "frozen", "tuple"):
+            actual = record_type(Named, record)(id=2, name="x")
+
+            assert_that(actual.label()).is_equal_to("#2")
+            assert_that(actual.double).is_equal_to(4)
+            assert_that(hasattr(actual, "__dict__")).is_false()
+
+    def test_tuple_records_run_post_init_with_both_engines(self):
+        for engine in ("dacite", "codegen"):
+            actual = compile_mapper(Shouted, engine=engine, record="tuple")({"id": 1, "name": "x"})
+
+            assert_that(actual).is_equal_to((1, "X"))
+
+    def test_slotted_records_support_zero_argument_super(self):
+        for record in ("slots", "frozen"):
+            for engine in ("dacite", "codegen"):
+                mapper = compile_mapper(CheckedName, engine=engine, record=record)
+
+                actual = mapper({"id": 1, "name": "x"})
+
+                assert_that(actual).is_equal_to(record_type(CheckedName, record)(1, "x"))
+                assert_that(hasattr(actual, "__dict__")).is_false()
+                assert_that(mapper).raises(ValueError).when_called_with({"id": -1, "name": "x"}).is_equal_to(
+                    "negative id"
+                )
+
+    @unittest.skipIf(sys.version_info < (3, 10), "kw_only requires Python 3.10")
+    def test_slotted_records_keep_keyword_only_fields(self):
+        @dataclass(kw_only=True)
+        class Window:
+            start: int = 0
+            end: int
+
+        for record in ("slots", "frozen"):
+            actual = record_type(Window, record)(end=2)
+
+            assert_that(actual.start).is_equal_to(0)
+            assert_that(actual.end).is_equal_to(2)
+            assert_that(record_type(Window, record)).raises(TypeError).when_called_with(1, 2)
+
+    def test_record_type_is_cached_and_records_are_picklable(self):
+        for record in ("slots", "frozen", "tuple"):
+            record_class = record_type(DateAttribute, record)
+            instance = record_class("1", "2", "3", None, "type", False, datetime(2022, 3, 19))
+
+            assert_that(record_type(DateAttribute, record)).is_same_as(record_class)
+            assert_that(pickle.loads(pickle.dumps(instance))).is_equal_to(instance)
+
+    def test_record_type_returns_data_class_itself_by_default(self):
+        assert_that(record_type(Tag)).is_same_as(Tag)
+
+    def test_record_type_when_invalid_record(self):
+        assert_that(record_type).raises(AttributeError).when_called_with(Tag, "list").is_equal_to(
+            "Invalid record list passed, expected one of dataclass, slots, frozen, tuple!"
+        )
@@ -0,0 +1,94 @@
+import unittest
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from types import GeneratorType
+
+from assertpy import assert_that
+
+from datamap.dicts import from_dict
+from datamap.serializers import compile_serializer, key_path, to_dict, to_dicts
+from tests.unit.fixtures.date_attributes import DateAttribute
+from tests.unit.fixtures.relations import Asset, AssetType, Relation
+from tests.unit.fixtures.tags import Tag
+
+ASSET_NAME = "2022-03-17 #1"
+TYPE_NAME = "Effective End Date"
+
+
+class Status(Enum):
+    ACTIVE = "active"
+
+
+@dataclass
+class Subscription:
+    id: str
+    status: Status
+
+
+class SerializerTestCase(unittest.TestCase):
+    def test_to_dict_converts_keys_to_camel_case_and_datetimes_to_epoch_milliseconds(self):
+        value = datetime(2022, 3, 19, 1)
+        created_on = datetime(2022, 3, 17, 13, 40, 29, 437000)
+        date_attribute = DateAttribute(id="1", created_by="2", asset_id="3", asset_name=ASSET_NAME,
+                                       type_name=TYPE_NAME, system=False, value=value, created_on=created_on)
+
+        actual = to_dict(date_attribute, unflatten=["asset", "type"])
+
+        assert_that(actual).is_equal_to({"id": "1", "createdBy": "2", "asset": {"id": "3", "name": ASSET_NAME},
+                                         "type": {"name": TYPE_NAME}, "system": False,
+                                         "value": round(value.timestamp() * 1000),
+                                         "createdOn": round(created_on.timestamp() * 1000)})
+
+    def test_to_dict_is_reverse_of_from_dict(self):
+        data = {"id": "1", "createdBy": "2", "asset": {"id": "3", "name": ASSET_NAME},
+                "type": {"name": TYPE_NAME}, "system": True, "value": 1647648000000, "createdOn": 1647520829437}
+
+        actual = to_dict(from_dict(data, data_class=DateAttribute, flatten=True), unflatten=["asset", "type"])
+
+        assert_that(actual).is_equal_to(data)
+
+    def test_to_dict_applies_rename_and_remove_in_reverse(self):
+        tag = Tag(id=1, tag="x", filter="f", color_code="red", is_visible=True)
+
+        actual = to_dict(tag, rename=[("visible", "is_visible")], remove=["is_category_model_tag"])
+
+        assert_that(actual).is_equal_to({"id": 1, "tag": "x", "filter": "f", "colorCode": "red",
+                                         "isSmartTag": False, "visible": True})
+
+    def test_to_dict_when_suppress_none(self):
+        actual = to_dict(Tag(id=1, tag="x", filter="f", color_code="red"), suppress_none=True)
+
+        assert_that(actual).does_not_contain_key("isCategoryModelTag")
+
+    def test_to_dict_serializes_nested_data_classes_and_enums(self):
+        relation = Relation("1", Asset("2", AssetType("3", "Table"), "source"), [Asset("4", AssetType("5", "Column"))])
+
+        assert_that(to_dict(relation)).is_equal_to(
+            {"id": "1", "source": {"id": "2", "type": {"id": "3", "name": "Table"}, "displayName": "source"},
+             "targets": [{"id": "4", "type": {"id": "5", "name": "Column"}, "displayName": None}]}
+        )
+        assert_that(to_dict(Subscription("1", Status.ACTIVE))).is_equal_to({"id": "1", "status": "active"})
+
+    def test_to_dict_when_invalid_argument(self):
+        assert_that(to_dict).raises(AttributeError).when_called_with({"id": 1}).is_equal_to(
+            "Invalid argument type dict passed as data, expected a dataclass instance!"
+        )
+
+    def test_to_dicts_keeps_collections_and_streams_generators(self):
+        tags = [Tag(id=1, tag="x", filter="f", color_code="red"), None]
+
+        assert_that(to_dicts(tags)).is_length(2).contains(None)
+        assert_that(to_dicts(iter(tags))).is_instance_of(GeneratorType)
+        assert_that(list(to_dicts(tag for tag in tags))).is_equal_to(to_dicts(tags))
+        assert_that(to_dicts(tags[0])).is_equal_to(to_dict(tags[0]))
+
+    def test_compile_serializer_returns_same_serializer_for_same_options(self):
+        actual = compile_serializer(Tag, unflatten=["color"])
+
+        assert_that(actual).is_same_as(compile_serializer(Tag, unflatten=("color",)))
+
+    def test_key_path_splits_merged_keys_of_nested_paths(self):
+        assert_that(key_path("assetTypeName", ["asset", "asset.type"])).is_equal_to(("asset", "type", "name"))
+        assert_that(key_path("assetName", ["asset", "asset.type"])).is_equal_to(("asset", "name"))
+        assert_that(key_path("assets", ["asset"])).is_equal_to(("assets",))
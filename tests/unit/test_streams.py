@@ -0,0 +1,93 @@
+import unittest
+
+from assertpy import assert_that
+
+from datamap.streams import flatten_pages, from_stream
+from tests.unit.fixtures.tags import Tag, stream_tags
+
+TAGS = [
+    {"id": index, "tag": f"tag {index}", "filter": f"usertag:\"{index}\"", "colorCode": "rgb(83,146,255)"}
+    for index in range(10)
+]
+
+
+def pages(size=3):
+    for offset in range(0, len(TAGS), size):
+        yield TAGS[offset:offset + size]
+
+
+class StreamsTestCase(unittest.TestCase):
+    def test_flatten_pages(self):
+        actual = list(flatten_pages(iter([[{"id": 1}], iter([{"id": 2}, {"id": 3}]), {"id": 4}])))
+
+        assert_that(actual).is_equal_to([{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}])
+
+    def test_from_stream_flattens_pages_into_records(self):
+        actual = list(from_stream(pages(), data_class=Tag, chunk_size=4))
+
+        assert_that(actual).is_length(10)
+        assert_that([tag.id for tag in actual]).is_equal_to(list(range(10)))
+        assert_that(actual[0]).is_type_of(Tag)
+
+    def test_from_stream_is_lazy(self):
+        consumed = []
+
+        def records():
+            for record in TAGS:
+                consumed.append(record)
+                yield record
+
+        actual = from_stream(records(), data_class=Tag, chunk_size=2)
+
+        assert_that(consumed).is_empty()
+        assert_that(next(actual).id).is_equal_to(0)
+        assert_that(consumed).is_length(2)
+
+    def test_from_stream_with_prefetch(self):
+        actual = list(from_stream(pages(), data_class=Tag, chunk_size=2, prefetch=2))
+
+        assert_that([tag.id for tag in actual]).is_equal_to(list(range(10)))
+
+    def test_from_stream_with_prefetch_propagates_errors(self):
+        def records():
+            yield TAGS[0]
+            raise ConnectionError("Connection lost")
+
+        with self.assertRaises(ConnectionError):
+            list(from_stream(records(), data_class=Tag, chunk_size=1, prefetch=1))
+
+    def test_from_stream_without_dataclass(self):
+        actual = list(from_stream(pages(), chunk_size=4))
+
+        assert_that(actual[9]).is_equal_to(
+            {"id": 9, "tag": "tag 9", "filter": "usertag:\"9\"", "color_code": "rgb(83,146,255)"}
+        )
+
+    def test_from_stream_when_illegal_argument(self):
+        with self.assertRaises(AttributeError) as context:
+            from_stream({})
+
+        assert_that(str(context.exception)).is_equal_to(
+            "Invalid argument type dict passed as data, expected an iterable!"
+        )
+
+    def test_datastream(self):
+        actual = list(stream_tags())
+
+        assert_that(actual).is_length(4)
+        assert_that(actual[3].tag).is_equal_to("_Info Search")
+        assert_that(actual[0].is_visible).is_true()
+
+    def test_from_stream_collects_errors_with_index_in_stream(self):
+        errors = []
+        data = [TAGS[:4], [{"id": 4.5, "tag": "tag 4", "filter": "", "colorCode": ""}], TAGS[5:]]
+
+        actual = list(from_stream(data, data_class=Tag, chunk_size=3, errors=errors))
+
+        assert_that(actual).is_length(9)
+        assert_that(errors).extracting("index", "field", "value").is_equal_to([(4, "id", 4.5)])
+
+    def test_from_stream_collecting_errors_without_data_class(self):
+        assert_that(from_stream).raises(AttributeError).when_called_with(pages(), errors=[]).is_equal_to(
+            "Collecting errors requires a data_class, it can't be resolved from a module!"
+        )
@@ -1,11 +1,15 @@
 import os
 import time
 import unittest
-from datetime import datetime
+from dataclasses import fields
+from datetime import datetime, timezone
 
 from assertpy import assert_that
 
-from datamap.time import parse_timestamp
+from datamap.converters import ConverterRegistry
+from datamap.mappers import compile_mapper
+from datamap.time import EPOCH, TimestampConverter, detect_unit, parse_timestamp, parse_timestamps
+from tests.unit.fixtures.date_attributes import DateAttribute
 
 
 class TimeTestCase(unittest.TestCase):
@@ -35,3 +39,107 @@ class TimeTestCase(unittest.TestCase):
         actual = parse_timestamp(1668629719)
 
         assert_that(actual).is_equal_to(datetime(2022, 11, 16, 21, 15, 19))
+
+    def test_parse_timestamps(
+            self,
+    ):
+        actual = parse_timestamps([1647520829437, None, 1668629719])
+
+        assert_that(actual).is_equal_to([datetime(2022, 3, 17, 13, 40, 29, 437000), None, datetime(2022, 11, 16, 21, 15, 19)])
+
+    def test_parse_timestamp_exposes_batch_converter(
+            self,
+    ):
+        assert_that(parse_timestamp.convert_many).is_same_as(parse_timestamps)
+
+    def test_parse_timestamp_when_microseconds_or_nanoseconds(
+            self,
+    ):
+        assert_that(parse_timestamp(1647520829437123)).is_equal_to(datetime(2022, 3, 17, 13, 40, 29, 437123))
+        assert_that(parse_timestamps([1647520829437123456])).is_equal_to([datetime(2022, 3, 17, 13, 40, 29, 437123)])
+
+    def test_detect_unit(
+            self,
+    ):
+        actual = [detect_unit(value) for value in (1668629719, 1647520829437, 1647520829437123, 1647520829437123456)]
+
+        assert_that(actual).is_equal_to(["s", "ms", "us", "ns"])
+
+    def test_timestamp_converter_with_explicit_unit_and_timezone(
+            self,
+    ):
+        converter = TimestampConverter(unit="us", tz=timezone.utc)
+
+        actual = converter(1647520829437123)
+
+        assert_that(actual).is_equal_to(datetime(2022, 3, 17, 12, 40, 29, 437123, tzinfo=timezone.utc))
+        assert_that(converter(None)).is_none()
+        assert_that(converter(True)).is_true()
+
+    def test_timestamp_converter_detects_unit_once_from_first_value(
+            self,
+    ):
+        converter = TimestampConverter(tz=timezone.utc)
+
+        actual = converter.convert_many([None, 1647520829437, 1647520829])
+
+        assert_that(converter.unit).is_equal_to("ms")
+        assert_that(actual).is_equal_to([
+            None,
+            datetime(2022, 3, 17, 12, 40, 29, 437000, tzinfo=timezone.utc),
+            datetime(1970, 1, 20, 1, 38, 40, 829000, tzinfo=timezone.utc),
+        ])
+
+    def test_timestamp_converter_redetects_unit_when_value_is_out_of_range_of_detected_unit(
+            self,
+    ):
+        expected = datetime(2022, 3, 17, 12, 40, 29, 437000, tzinfo=timezone.utc)
+
+        for convert in (lambda converter, values: [converter(value) for value in values],
+                        lambda converter, values: converter.convert_many(values)):
+            converter = TimestampConverter(tz=timezone.utc)
+
+            actual = convert(converter, [0, 1647520829437, 1647520829437])
+
+            assert_that(actual).is_equal_to([EPOCH, expected, expected])
+            assert_that(converter.unit).is_equal_to("ms")
+
+    def test_timestamp_converter_keeps_redetected_unit_for_rest_of_batch(
+            self,
+    ):
+        expected = datetime(2022, 3, 19, tzinfo=timezone.utc)
+
+        for convert in (lambda converter, values: [converter(value) for value in values],
+                        lambda converter, values: converter.convert_many(values)):
+            converter = TimestampConverter(tz=timezone.utc)
+
+            actual = convert(converter, [0, 1647648000000, 1647648000])
+
+            assert_that(actual).is_equal_to([EPOCH, expected, datetime(1970, 1, 20, 1, 40, 48, tzinfo=timezone.utc)])
+            assert_that(converter.unit).is_equal_to("ms")
+
+    def test_timestamp_converter_is_bound_per_field_when_unit_is_detected(
+            self,
+    ):
+        registry = ConverterRegistry()
+        registry.register(int, datetime, TimestampConverter(tz=timezone.utc))
+        data = {"id": "1", "createdBy": "2", "system": False, "type": {"name": "Effective End Date"},
+                "asset": {"id": "3"}, "value": 1647648000000, "createdOn": 1647520829}
+
+        actual = compile_mapper(DateAttribute, flatten=True, registry=registry)(data)
+
+        assert_that(actual.value).is_equal_to(datetime(2022, 3, 19, tzinfo=timezone.utc))
+        assert_that(actual.created_on).is_equal_to(datetime(2022, 3, 17, 12, 40, 29, tzinfo=timezone.utc))
+        value, created_on = (
+            registry.resolve(attribute, int) for attribute in fields(DateAttribute)
+            if attribute.name in ("value", "created_on")
+        )
+        assert_that(value.unit).is_equal_to("ms")
+        assert_that(created_on.unit).is_equal_to("s")
+
+    def test_timestamp_converter_when_invalid_unit(
+            self,
+    ):
+        assert_that(TimestampConverter).raises(AttributeError).when_called_with(unit="h").is_equal_to(
+            "Invalid unit h passed, expected one of s, ms, us, ns!"
+        )
@@ -0,0 +1,113 @@
+import unittest
+
+from assertpy import assert_that
+from dacite import MissingValueError, WrongTypeError
+
+from datamap.decorators import datamap
+from datamap.dicts import from_dicts
+from datamap.mappers import compile_mapper
+from datamap.validation import Validation, type_mismatches
+from tests.unit.fixtures.tags import Tag
+
+TAGS = [
+    {"id": index, "tag": f"tag {index}", "filter": "f", "colorCode": "red"}
+    for index in range(10)
+]
+
+
+class ValidationTestCase(unittest.TestCase):
+    def test_full_validation_raises_on_wrong_type(self):
+        for engine in ("dacite", "codegen"):
+            assert_that(from_dicts).raises(WrongTypeError).when_called_with(
+                [{**TAGS[0], "id": 1.5}], data_class=Tag, engine=engine
+            )
+
+    def test_no_validation_skips_type_checks_but_not_missing_values(self):
+        for engine in ("dacite", "codegen"):
+            actual = from_dicts(
+                [{**TAGS[0], "id": 1.5}],
+                data_class=Tag,
+                engine=engine,
+                validation="none",
+            )
+
+            assert_that(actual[0].id).is_equal_to(1.5)
+            assert_that(from_dicts).raises(MissingValueError).when_called_with(
+                [{"id": 1}], data_class=Tag, engine=engine, validation="none"
+            )
+
+    def test_sampled_validation_reports_mismatches_of_sampled_records_through_callback(
+        self,
+    ):
+        mismatches = []
+        validation = Validation(
+            "sampled",
+            every=4,
+            callback=lambda instance, error: mismatches.append(
+                (instance.tag, error.field_path, error.value)
+            ),
+        )
+        data = [{**tag, "id": tag["id"] + 0.5} for tag in TAGS]
+
+        for engine in ("dacite", "codegen"):
+            mismatches.clear()
+            actual = compile_mapper(Tag, engine=engine, validation=validation).map_many(
+                data
+            )
+
+            assert_that(actual).extracting("id").is_equal_to(
+                [index + 0.5 for index in range(10)]
+            )
+            assert_that(mismatches).is_equal_to(
+                [("tag 0", "id", 0.5), ("tag 4", "id", 4.5), ("tag 8", "id", 8.5)]
+            )
+
+    def test_sampled_validation_without_callback_raises_on_mismatch(self):
+        mapper = compile_mapper(Tag, validation=Validation("sampled", every=2))
+
+        assert_that(mapper).raises(WrongTypeError).when_called_with(
+            {**TAGS[0], "id": 1.5}
+        )
+        assert_that(mapper({**TAGS[1], "id": 2.5}).id).is_equal_to(2.5)
+
+    def test_datamap_with_validation(self):
+        @datamap(Tag, validation="none")
+        def get_tags():
+            return [{**TAGS[0], "id": 1.5}]
+
+        assert_that(get_tags()[0].id).is_equal_to(1.5)
+
+    def test_type_mismatches(self):
+        actual = type_mismatches(
+            Tag, Tag(id=1.5, tag="x", filter="f", color_code="red")
+        )
+
+        assert_that(actual).extracting("field_path").is_equal_to(["id"])
+
+    def test_compile_mapper_when_invalid_validation(self):
+        assert_that(compile_mapper).raises(AttributeError).when_called_with(
+            Tag, validation="partial"
+        ).is_equal_to(
+            "Invalid validation partial passed, expected one of full, sampled, none!"
+        )
+
+    def test_columnar_output_is_validated_like_rows(self):
+        assert_that(from_dicts).raises(WrongTypeError).when_called_with(
+            [{**TAGS[0], "tag": 2}], data_class=Tag, columnar=True
+        )
+        assert_that(from_dicts).raises(WrongTypeError).when_called_with(
+            [{**TAGS[0], "id": None}], data_class=Tag, columnar=True
+        )
+
+        actual = from_dicts([{**TAGS[0], "id": None}], data_class=Tag, columnar=True, validation="none")
+
+        assert_that(actual["id"]).is_equal_to([None])
+
+    def test_columnar_output_with_sampled_validation(self):
+        mismatches = []
+        validation = Validation("sampled", every=4, callback=lambda record, error: mismatches.append(record["tag"]))
+
+        from_dicts([{**tag, "id": tag["id"] + 0.5} for tag in TAGS], data_class=Tag, columnar=True,
+                   validation=validation)
+
+        assert_that(mismatches).is_equal_to(["tag 0", "tag 4", "tag 8"])